@@ -6,10 +6,29 @@ from circleshape import CircleShape
 from constants import *
 from enemy_projectile import EnemyProjectile
 from effects import EffectManager
+from spatial_hash import SpatialHash
+
+# Module-local bindings so hot per-frame/per-spawn code skips the
+# math.* / random.* attribute lookups
+_cos = math.cos
+_sin = math.sin
+_rand = random.random
+_uniform = random.uniform
+_choice = random.choice
+_randrange = random.randrange
 
 # Global effect manager
 effect_manager = None
 
+# Precomputed, evenly spaced unit vectors for explosive fragments
+_EXPLOSION_DIRS = tuple(
+    pygame.Vector2(
+        math.cos(2 * math.pi * i / EXPLOSIVE_PROJECTILE_COUNT),
+        math.sin(2 * math.pi * i / EXPLOSIVE_PROJECTILE_COUNT),
+    )
+    for i in range(EXPLOSIVE_PROJECTILE_COUNT)
+)
+
 # Import sound to avoid circular imports
 try:
     from sound import SoundManager
@@ -18,6 +37,17 @@ except ImportError:
     sound_manager = None
 
 class Asteroid(CircleShape):
+    # Slot the per-instance fields so attribute access uses fixed offsets
+    # instead of dict lookups (the pygame Sprite base still carries a
+    # __dict__, so this is an access-speed win rather than a memory one)
+    __slots__ = (
+        'asteroid_type', '_score_value', 'hits_remaining', 'color_variant',
+        'sprite', '_base_sprite', '_rotations', '_pooled', '_draw_rect',
+        '_grid_cell', 'hit_flash_timer', 'is_hit', 'shield_animation_angle',
+        'shield_pulse', 'shield_growing', 'trail_timer',
+        'rotation', 'rotation_speed',
+    )
+
     # Class variables for sprite collections
     meteor_sprites = {
         'brown': {
@@ -35,71 +65,81 @@ class Asteroid(CircleShape):
     }
     
     sprites_loaded = False
-    
+
+    # Pre-rendered glow surfaces for explosive asteroids, keyed by radius
+    _glow_cache = {}
+
+    # Tinted base sprites shared across instances, keyed by
+    # (scaled-sprite key, asteroid type)
+    _tinted_cache = {}
+
+    # Pre-rendered white hit-flash overlays keyed by (size, alpha bucket);
+    # alpha is quantized to 16 steps so the fade stays smooth but cacheable
+    _flash_cache = {}
+
+    # Pre-rendered rotation frames (every 10 degrees), shared between
+    # asteroids of the same variant, size, sprite, and type
+    ROTATION_STEPS = 36
+    _rotation_cache = {}
+
+    # Pre-scaled sprites keyed by (variant, size category, sprite index,
+    # integer radius) so spawn bursts don't re-run pygame.transform.scale
+    _scaled_cache = {}
+
+    # Free list of killed asteroids reused by spawn() to avoid allocation
+    # churn while splitting
+    _pool = []
+    _POOL_MAX = 64
+
+    # Broadphase grid so collision checks only test nearby asteroids
+    _grid = SpatialHash(cell_size=2 * ASTEROID_MAX_RADIUS)
+    # Largest radius an asteroid spawns with; queries inflate by this
+    _MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+
+    # Pre-rendered dashed shield ring, drawn once at a reference radius and
+    # rotated/scaled per frame instead of issuing 8 line calls per ring
+    _SHIELD_RING_RADIUS = 64
+    _shield_ring = None
+
+    # Precomputed unit vectors for the dashed shield ring: for each drawn
+    # segment (every other one of 16), the (cos, sin) pairs at the segment
+    # start and at 0.8 of the way to the next segment
+    _SHIELD_SEGMENTS = tuple(
+        (
+            _cos(j * 2 * math.pi / 16),
+            _sin(j * 2 * math.pi / 16),
+            _cos((j + 0.8) * 2 * math.pi / 16),
+            _sin((j + 0.8) * 2 * math.pi / 16),
+        )
+        for j in range(16)
+        if j % 2 == 0
+    )
+
+    # Sprite sheet layout: (size category, filename abbreviation, file count)
+    _SPRITE_FILES = (
+        ('big', 'big', 4),
+        ('medium', 'med', 2),
+        ('small', 'small', 2),
+        ('tiny', 'tiny', 2),
+    )
+
     @classmethod
     def load_sprites(cls):
         """Load all meteor sprites into class variables"""
         if cls.sprites_loaded:
             return
-            
-        # Brown meteors
-        for i in range(1, 5):  # big1 through big4
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorBrown_big{i}.png").convert_alpha()
-                cls.meteor_sprites['brown']['big'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorBrown_big{i}.png")
-                
-        for i in range(1, 3):  # med1 through med2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorBrown_med{i}.png").convert_alpha()
-                cls.meteor_sprites['brown']['medium'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorBrown_med{i}.png")
-                
-        for i in range(1, 3):  # small1 through small2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorBrown_small{i}.png").convert_alpha()
-                cls.meteor_sprites['brown']['small'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorBrown_small{i}.png")
-                
-        for i in range(1, 3):  # tiny1 through tiny2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorBrown_tiny{i}.png").convert_alpha()
-                cls.meteor_sprites['brown']['tiny'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorBrown_tiny{i}.png")
-                
-        # Grey meteors
-        for i in range(1, 5):  # big1 through big4
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorGrey_big{i}.png").convert_alpha()
-                cls.meteor_sprites['grey']['big'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorGrey_big{i}.png")
-                
-        for i in range(1, 3):  # med1 through med2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorGrey_med{i}.png").convert_alpha()
-                cls.meteor_sprites['grey']['medium'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorGrey_med{i}.png")
-                
-        for i in range(1, 3):  # small1 through small2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorGrey_small{i}.png").convert_alpha()
-                cls.meteor_sprites['grey']['small'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorGrey_small{i}.png")
-                
-        for i in range(1, 3):  # tiny1 through tiny2
-            try:
-                sprite = pygame.image.load(f"assets/images/Meteors/meteorGrey_tiny{i}.png").convert_alpha()
-                cls.meteor_sprites['grey']['tiny'].append(sprite)
-            except pygame.error:
-                print(f"Error loading meteorGrey_tiny{i}.png")
-                
+
+        # Brown and grey meteors, driven by the layout table above
+        for color in ('brown', 'grey'):
+            for size_category, abbrev, count in cls._SPRITE_FILES:
+                for i in range(1, count + 1):
+                    filename = f"assets/images/Meteors/meteor{color.title()}_{abbrev}{i}.png"
+                    if os.path.exists(filename):
+                        sprite = pygame.image.load(filename).convert_alpha()
+                        cls.meteor_sprites[color][size_category].append(sprite)
+                    else:
+                        print(f"Error loading {os.path.basename(filename)}")
+
         # Load fallback sprites if needed
         if not cls.meteor_sprites['brown']['big'] and not cls.meteor_sprites['grey']['big']:
             try:
@@ -118,29 +158,116 @@ class Asteroid(CircleShape):
                 print("Error loading fallback meteorSmall.png")
                 
         cls.sprites_loaded = True
-    
+
+    @classmethod
+    def _get_shield_ring(cls):
+        """Get (or render once) the dashed shield ring surface"""
+        if cls._shield_ring is None:
+            ref = cls._SHIELD_RING_RADIUS
+            size = 2 * (ref + 4)
+            center = size / 2
+            ring_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            for c1, s1, c2, s2 in cls._SHIELD_SEGMENTS:
+                pygame.draw.line(
+                    ring_surf,
+                    (150, 150, 255),
+                    (center + c1 * ref, center + s1 * ref),
+                    (center + c2 * ref, center + s2 * ref),
+                    width=4
+                )
+            cls._shield_ring = ring_surf.convert_alpha()
+        return cls._shield_ring
+
+    @classmethod
+    def _get_flash(cls, size, alpha_bucket):
+        """Get (or render once) a white flash overlay for a sprite size"""
+        key = (size, alpha_bucket)
+        overlay = cls._flash_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((255, 255, 255, alpha_bucket * 17))
+            cls._flash_cache[key] = overlay
+        return overlay
+
+    @classmethod
+    def _get_glow(cls, radius):
+        """Get (or render once) the fiery glow surface for an explosive asteroid"""
+        key = int(radius)
+        glow_surf = cls._glow_cache.get(key)
+        if glow_surf is None:
+            glow_size = key * 1.3
+            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            glow_color = (255, 100, 0, 40)  # Semi-transparent orange
+            pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
+            cls._glow_cache[key] = glow_surf
+        return glow_surf
+
     def __init__(self, x, y, radius, asteroid_type=None):
         super().__init__(x, y, radius)
-        
+        self._pooled = False
+        self._grid_cell = None
+        self._draw_rect = None
+        self._setup(radius, asteroid_type)
+
+    @classmethod
+    def spawn(cls, x, y, radius, asteroid_type=None):
+        """Create an asteroid, reusing a pooled instance when available"""
+        if cls._pool:
+            asteroid = cls._pool.pop()
+            asteroid._pooled = False
+            if hasattr(asteroid, "containers"):
+                asteroid.add(asteroid.containers)
+            asteroid.position.update(x, y)
+            asteroid.velocity.update(0, 0)
+            asteroid.radius = radius
+            asteroid._setup(radius, asteroid_type)
+            return asteroid
+        return cls(x, y, radius, asteroid_type)
+
+    @classmethod
+    def query_near(cls, x, y, radius):
+        """Return asteroids whose circles could overlap the given circle"""
+        return cls._grid.query(x, y, radius + cls._MAX_RADIUS)
+
+    @classmethod
+    def reset_grid(cls):
+        """Clear the broadphase grid (e.g. when a new game starts)"""
+        cls._grid.clear()
+
+    def kill(self):
+        """Remove from all groups and return the instance to the pool"""
+        super().kill()
+        if self._grid_cell is not None:
+            Asteroid._grid.remove(self, self._grid_cell)
+            self._grid_cell = None
+        if not self._pooled and len(Asteroid._pool) < Asteroid._POOL_MAX:
+            self._pooled = True
+            Asteroid._pool.append(self)
+
+    def _setup(self, radius, asteroid_type):
+        """(Re)initialize per-spawn state; called on creation and pool reuse"""
         # Create effect manager if not already created
         global effect_manager
         if effect_manager is None:
             effect_manager = EffectManager()
         
-        # Load meteor sprites if not already loaded
-        Asteroid.load_sprites()
-            
         # Randomly select asteroid type if not specified
         if asteroid_type is None:
-            # Initially more regular asteroids, with lower chances for special types
-            weights = [0.7, 0.15, 0.15]  # Regular, Explosive, Armored
-            asteroid_types = [ASTEROID_TYPE_REGULAR, ASTEROID_TYPE_EXPLOSIVE, ASTEROID_TYPE_ARMORED]
-            self.asteroid_type = random.choices(asteroid_types, weights=weights)[0]
+            # Initially more regular asteroids, with lower chances for special
+            # types (70% regular, 15% explosive, 15% armored); a direct
+            # threshold check is much cheaper than random.choices per spawn
+            roll = _rand()
+            if roll < 0.7:
+                self.asteroid_type = ASTEROID_TYPE_REGULAR
+            elif roll < 0.85:
+                self.asteroid_type = ASTEROID_TYPE_EXPLOSIVE
+            else:
+                self.asteroid_type = ASTEROID_TYPE_ARMORED
         else:
             self.asteroid_type = asteroid_type
             
-        self.score_value = self._get_score_value()
-        
+        self._score_value = None  # Computed on demand (read on destruction)
+
         # For armored asteroids
         if self.asteroid_type == ASTEROID_TYPE_ARMORED:
             self.hits_remaining = ARMORED_HITS_REQUIRED
@@ -148,7 +275,7 @@ class Asteroid(CircleShape):
             self.hits_remaining = 1
         
         # Randomly choose between brown and grey meteor variants
-        self.color_variant = random.choice(['brown', 'grey'])
+        self.color_variant = _choice(['brown', 'grey'])
         
         # Select size category based on radius
         if self.radius >= ASTEROID_MIN_RADIUS * 2.5:
@@ -162,29 +289,41 @@ class Asteroid(CircleShape):
             
         # Select random sprite from appropriate category
         sprites = Asteroid.meteor_sprites[self.color_variant][size_category]
-        if sprites:
-            original_sprite = random.choice(sprites)
-        else:
+        if not sprites:
             # Fallback if no sprites found for this category
             if size_category in ['big', 'medium']:
-                original_sprite = random.choice(Asteroid.meteor_sprites['brown']['big'] or Asteroid.meteor_sprites['grey']['big'])
+                sprites = Asteroid.meteor_sprites['brown']['big'] or Asteroid.meteor_sprites['grey']['big']
             else:
-                original_sprite = random.choice(Asteroid.meteor_sprites['brown']['small'] or Asteroid.meteor_sprites['grey']['small'])
-            
-        # Scale sprite to match asteroid radius
-        # Compute scale factor to maintain aspect ratio
-        sprite_size = self.radius * 2  # Diameter
-        original_width, original_height = original_sprite.get_size()
-        scale_factor = sprite_size / max(original_width, original_height)
-        new_width = int(original_width * scale_factor)
-        new_height = int(original_height * scale_factor)
-        
-        self.sprite = pygame.transform.scale(original_sprite, (new_width, new_height))
-        
+                sprites = Asteroid.meteor_sprites['brown']['small'] or Asteroid.meteor_sprites['grey']['small']
+        sprite_index = _randrange(len(sprites))
+        original_sprite = sprites[sprite_index]
+
+        # Scale sprite to match asteroid radius (cached per look-alike key)
+        scale_key = (self.color_variant, size_category, sprite_index, int(self.radius))
+        self.sprite = Asteroid._get_scaled(scale_key, original_sprite, self.radius)
+
+        # Pre-tinted sprites for special variants, shared across every
+        # asteroid with the same look rather than tinted per instance
+        if self.asteroid_type == ASTEROID_TYPE_EXPLOSIVE:
+            self._base_sprite = Asteroid._get_tinted(
+                scale_key, self.asteroid_type, self.sprite, (255, 100, 0, 35))
+        elif self.asteroid_type == ASTEROID_TYPE_ARMORED:
+            self._base_sprite = Asteroid._get_tinted(
+                scale_key, self.asteroid_type, self.sprite, (100, 100, 255, 35))
+        else:
+            self._base_sprite = self.sprite
+
+        # Pre-rendered rotation frames, shared across look-alike asteroids
+        self._rotations = Asteroid._get_rotations(
+            (self.color_variant, size_category, sprite_index,
+             self.asteroid_type, int(self.radius)),
+            self._base_sprite
+        )
+
         # Special visual effects initialization
         self.hit_flash_timer = 0
         self.is_hit = False
-        self.shield_animation_angle = random.uniform(0, 360)
+        self.shield_animation_angle = _uniform(0, 360)
         self.shield_pulse = 0
         self.shield_growing = True
         
@@ -192,8 +331,64 @@ class Asteroid(CircleShape):
         self.trail_timer = 0
         
         # Random rotation for variety
-        self.rotation = random.randrange(0, 360)
-        self.rotation_speed = random.randrange(-30, 30)
+        self.rotation = _randrange(0, 360)
+        self.rotation_speed = _randrange(-30, 30)
+
+        # File into the broadphase grid for collision queries
+        self._grid_cell = Asteroid._grid.insert(self)
+
+    @classmethod
+    def _get_scaled(cls, key, original_sprite, radius):
+        """Get (or scale once) the sprite scaled to the asteroid radius"""
+        scaled = cls._scaled_cache.get(key)
+        if scaled is None:
+            # Compute scale factor to maintain aspect ratio
+            sprite_size = radius * 2  # Diameter
+            original_width, original_height = original_sprite.get_size()
+            scale_factor = sprite_size / max(original_width, original_height)
+            new_width = int(original_width * scale_factor)
+            new_height = int(original_height * scale_factor)
+            scaled = pygame.transform.scale(original_sprite, (new_width, new_height))
+            cls._scaled_cache[key] = scaled
+        return scaled
+
+    @classmethod
+    def _get_rotations(cls, key, base_sprite):
+        """Get (or render once) the rotation frames for a base sprite"""
+        rotations = cls._rotation_cache.get(key)
+        if rotations is None:
+            rotations = [
+                pygame.transform.rotate(base_sprite, angle).convert_alpha()
+                for angle in range(0, 360, 360 // cls.ROTATION_STEPS)
+            ]
+            cls._rotation_cache[key] = rotations
+        return rotations
+
+    @classmethod
+    def _get_tinted(cls, scale_key, asteroid_type, sprite, tint_color):
+        """Get (or tint once) the variant-tinted base for a scaled sprite"""
+        key = (scale_key, asteroid_type)
+        tinted = cls._tinted_cache.get(key)
+        if tinted is None:
+            tinted = cls._tint_sprite(sprite, tint_color)
+            cls._tinted_cache[key] = tinted
+        return tinted
+
+    @staticmethod
+    def _tint_sprite(sprite, tint_color):
+        """Return a copy of the sprite with a subtle color tint applied"""
+        overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+        overlay.fill(tint_color)
+        tinted = sprite.copy()
+        tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        return tinted.convert_alpha()
+
+    @property
+    def score_value(self):
+        """Score awarded for destroying this asteroid (computed on demand)"""
+        if self._score_value is None:
+            self._score_value = self._get_score_value()
+        return self._score_value
 
     def _get_score_value(self):
         """Calculate score value based on asteroid size and type"""
@@ -215,33 +410,72 @@ class Asteroid(CircleShape):
         else:
             return base_score             # Regular asteroids
 
+    @classmethod
+    def draw_all(cls, screen, asteroids):
+        """Draw a group of asteroids, batching the plain sprite blits
+
+        Regular, non-flashing asteroids are collected into a single
+        Surface.blits call; special variants fall back to their own draw
+        for glow/shield effects.
+        """
+        batch = []
+        steps = cls.ROTATION_STEPS
+        for asteroid in asteroids:
+            if asteroid.asteroid_type == ASTEROID_TYPE_REGULAR and not asteroid.is_hit:
+                rotated = asteroid._rotations[int(asteroid.rotation / 10) % steps]
+                rect = asteroid._draw_rect
+                if rect is None:
+                    rect = asteroid._draw_rect = rotated.get_rect()
+                else:
+                    rect.size = rotated.get_size()
+                rect.center = (asteroid.position.x, asteroid.position.y)
+                batch.append((rotated, rect))
+            else:
+                asteroid.draw(screen)
+        if batch:
+            screen.blits(batch, doreturn=False)
+
+    def _blit_sprite(self, screen, rotated_sprite):
+        """Blit a rotated sprite centered on the asteroid's position"""
+        # Reuse one Rect per asteroid instead of allocating each frame
+        sprite_rect = self._draw_rect
+        if sprite_rect is None:
+            sprite_rect = self._draw_rect = rotated_sprite.get_rect()
+        else:
+            sprite_rect.size = rotated_sprite.get_size()
+        sprite_rect.center = (self.position.x, self.position.y)
+        screen.blit(rotated_sprite, sprite_rect)
+
     def draw(self, screen):
         """Draw the asteroid with unique visual indicators based on type"""
-        # Create a copy of the sprite to modify (for tinting)
-        sprite_copy = self.sprite.copy()
-        
-        # Apply color tint based on asteroid type
+        # Fast path for the common case: regular asteroids with no active
+        # hit flash need no glow, shield, or overlay work at all
+        if self.asteroid_type == ASTEROID_TYPE_REGULAR and not self.is_hit:
+            self._blit_sprite(
+                screen,
+                self._rotations[int(self.rotation / 10) % Asteroid.ROTATION_STEPS]
+            )
+            return
+
+        # Tinting was done once in __init__; only special effects remain here
+        sprite_copy = self._base_sprite
+
         if self.asteroid_type == ASTEROID_TYPE_EXPLOSIVE:
-            # Red/orange tint for explosive asteroids
-            red_overlay = pygame.Surface(sprite_copy.get_size(), pygame.SRCALPHA)
-            red_overlay.fill((255, 100, 0, 35))  # Subtle orange tint
-            sprite_copy.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            
-            # Add fiery glow effect
-            glow_size = self.radius * 1.3
-            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            glow_color = (255, 100, 0, 40)  # Semi-transparent orange
-            pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-            glow_rect = glow_surf.get_rect(center=self.position)
+            # Add fiery glow effect (pre-rendered once per radius)
+            glow_surf = Asteroid._get_glow(self.radius)
+            glow_rect = glow_surf.get_rect(center=(self.position.x, self.position.y))
             screen.blit(glow_surf, glow_rect, special_flags=pygame.BLEND_RGBA_ADD)
-            
+
             # Add trailing particles for explosive asteroids occasionally
-            if random.random() < 0.1:  # 10% chance each frame
-                # Random position on the asteroid's edge
-                angle = random.uniform(0, 2 * math.pi)
-                offset = pygame.Vector2(math.cos(angle), math.sin(angle)) * self.radius
-                particle_pos = self.position + offset
-                
+            if _rand() < 0.1:  # 10% chance each frame
+                # Random position on the asteroid's edge (plain float math,
+                # no intermediate Vector2)
+                angle = _uniform(0, 2 * math.pi)
+                particle_pos = (
+                    self.position.x + _cos(angle) * self.radius,
+                    self.position.y + _sin(angle) * self.radius
+                )
+
                 # Add a small ember particle
                 effect_manager.add_particle_system(
                     particle_pos,
@@ -254,11 +488,6 @@ class Asteroid(CircleShape):
                 )
             
         elif self.asteroid_type == ASTEROID_TYPE_ARMORED:
-            # Blue tint for armored asteroids
-            blue_overlay = pygame.Surface(sprite_copy.get_size(), pygame.SRCALPHA)
-            blue_overlay.fill((100, 100, 255, 35))  # Subtle blue tint
-            sprite_copy.blit(blue_overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            
             # Draw shield effect using shield animation
             # Pulse the shield size for a dynamic effect
             self.shield_pulse += 0.05 if self.shield_growing else -0.05
@@ -272,52 +501,46 @@ class Asteroid(CircleShape):
             # Rotate shield rings for a dynamic effect
             self.shield_animation_angle += 0.5
             
-            # Draw multiple shield rings with different rotations
+            # Draw multiple shield rings with different rotations; each ring
+            # is one rotozoom + blit of the pre-rendered dash pattern
+            ring_surf = Asteroid._get_shield_ring()
             for i in range(self.hits_remaining):
                 shield_radius = self.radius + 5 * self.shield_pulse - (2 * i)
-                num_segments = 16
-                segment_angle = 2 * math.pi / num_segments
-                start_angle = math.radians(self.shield_animation_angle + (i * 30))
-                
-                for j in range(num_segments):
-                    if j % 2 == 0:  # Draw every other segment for a dashed effect
-                        angle1 = start_angle + j * segment_angle
-                        angle2 = start_angle + (j + 0.8) * segment_angle
-                        start_pos = (
-                            self.position.x + math.cos(angle1) * shield_radius,
-                            self.position.y + math.sin(angle1) * shield_radius
-                        )
-                        end_pos = (
-                            self.position.x + math.cos(angle2) * shield_radius,
-                            self.position.y + math.sin(angle2) * shield_radius
-                        )
-                        pygame.draw.line(
-                            screen,
-                            (150, 150, 255),
-                            start_pos,
-                            end_pos,
-                            width=2
-                        )
+                scale = shield_radius / Asteroid._SHIELD_RING_RADIUS
+                ring = pygame.transform.rotozoom(
+                    ring_surf, -(self.shield_animation_angle + i * 30), scale)
+                screen.blit(ring, ring.get_rect(center=self.position))
         
-        # Add hit flash effect if recently hit
+        # Add hit flash effect if recently hit (only case that needs a copy)
         if self.is_hit and self.hit_flash_timer > 0:
-            # White flash effect
-            flash_alpha = int(255 * (self.hit_flash_timer / 0.2))  # Fade over 0.2 seconds
-            flash_overlay = pygame.Surface(sprite_copy.get_size(), pygame.SRCALPHA)
-            flash_overlay.fill((255, 255, 255, flash_alpha))
+            # White flash effect, fading over 0.2 seconds; overlays come
+            # from the cache, quantized to 16 alpha steps
+            alpha_bucket = min(15, int(15 * (self.hit_flash_timer / 0.2)))
+            flash_overlay = Asteroid._get_flash(sprite_copy.get_size(), alpha_bucket)
+            sprite_copy = sprite_copy.copy()
             sprite_copy.blit(flash_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
             
-        # Rotate and position the sprite
-        rotated_sprite = pygame.transform.rotate(sprite_copy, self.rotation)
-        sprite_rect = rotated_sprite.get_rect(center=self.position)
-        
+        # Rotate and position the sprite; the common case uses the cached
+        # rotation frames, only the hit flash rotates a live copy
+        if sprite_copy is self._base_sprite:
+            rotated_sprite = self._rotations[int(self.rotation / 10) % Asteroid.ROTATION_STEPS]
+        else:
+            rotated_sprite = pygame.transform.rotate(sprite_copy, self.rotation)
+
         # Draw the asteroid sprite
-        screen.blit(rotated_sprite, sprite_rect)
+        self._blit_sprite(screen, rotated_sprite)
     def update(self, dt):
-        self.position += (self.velocity * dt)
-        # Update rotation
+        # Integrate position/rotation with plain float math; avoids the
+        # temporary Vector2 that `position += velocity * dt` would build
+        position = self.position
+        velocity = self.velocity
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
         self.rotation += self.rotation_speed * dt
-        
+
+        # Keep the broadphase grid cell current
+        self._grid_cell = Asteroid._grid.move(self, self._grid_cell)
+
         # Update hit flash timer
         if self.hit_flash_timer > 0:
             self.hit_flash_timer -= dt
@@ -328,13 +551,17 @@ class Asteroid(CircleShape):
         if self.asteroid_type == ASTEROID_TYPE_EXPLOSIVE:
             self.trail_timer -= dt
             if self.trail_timer <= 0:
-                self.trail_timer = random.uniform(0.1, 0.3)  # Random interval for natural effect
+                self.trail_timer = _uniform(0.1, 0.3)  # Random interval for natural effect
                 
                 # Calculate position behind the asteroid based on velocity
-                if self.velocity.length() > 0:
-                    direction = self.velocity.normalize()
-                    trail_pos = self.position - direction * self.radius * 0.8
-                    
+                speed = self.velocity.length()
+                if speed > 0:
+                    scale = self.radius * 0.8 / speed
+                    trail_pos = (
+                        self.position.x - self.velocity.x * scale,
+                        self.position.y - self.velocity.y * scale
+                    )
+
                     # Add trail particle
                     effect_manager.add_particle_system(
                         trail_pos,
@@ -373,13 +600,18 @@ class Asteroid(CircleShape):
                 if sound_manager:
                     sound_manager.play_sound('armor_hit')
                 
-                # Add shield impact effect
-                shield_impact_surf = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
-                shield_color = (100, 150, 255, 150)  # Blue shield color
-                pygame.draw.circle(shield_impact_surf, shield_color, 
-                                 (self.radius * 2, self.radius * 2), self.radius * 1.5, 3)
-                shield_rect = shield_impact_surf.get_rect(center=self.position)
-                
+                # Add shield impact effect through the particle pipeline
+                # (the old hand-built surface was never blitted)
+                effect_manager.add_particle_system(
+                    self.position,
+                    effect_type="sparkle",
+                    colors=[(100, 150, 255, 150), (150, 200, 255, 150)],
+                    particle_count=6,
+                    size_range=(1, 3),
+                    speed_range=(40, 80),
+                    duration=0.3
+                )
+
                 return False  # Not destroyed yet
         
         # Handle explosion for explosive asteroid
@@ -406,18 +638,13 @@ class Asteroid(CircleShape):
             duration=1.0
         )
             
-        # Create projectiles in all directions
+        # Create projectiles in all directions (directions precomputed)
         projectiles = []
-        for i in range(EXPLOSIVE_PROJECTILE_COUNT):
-            angle = 360 * i / EXPLOSIVE_PROJECTILE_COUNT
+        for direction in _EXPLOSION_DIRS:
             projectile = EnemyProjectile(self.position.x, self.position.y)
-            
-            # Direction based on angle
-            direction = pygame.Vector2(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
             projectile.velocity = direction * EXPLOSIVE_PROJECTILE_SPEED
-            
             projectiles.append(projectile)
-            
+
         return projectiles
         
     def split(self):
@@ -459,30 +686,34 @@ class Asteroid(CircleShape):
             colors=[(200, 200, 200, 200), (150, 150, 150, 200)]
         )
         
-        # Kill the current asteroid
-        self.kill()
-        
         # Check if asteroid is too small to split
         if self.radius < ASTEROID_MIN_RADIUS:
+            self.kill()
             return True  # Destroyed but no new asteroids
-            
+
         # Create two new smaller asteroids
-        angle = random.uniform(20, 50)
+        angle = _uniform(20, 50)
         v1 = self.velocity.rotate(angle) * 1.2
         v2 = self.velocity.rotate(-angle)
         
         # Smaller asteroids have a higher chance of being regular type
-        if random.random() < 0.7:
+        if _rand() < 0.7:
             new_type = ASTEROID_TYPE_REGULAR
         else:
             # Choose between explosive and armored for variety
-            new_type = random.choice([ASTEROID_TYPE_EXPLOSIVE, ASTEROID_TYPE_ARMORED])
+            new_type = _choice([ASTEROID_TYPE_EXPLOSIVE, ASTEROID_TYPE_ARMORED])
             
         # Create new asteroids of possibly different types    
-        a1 = Asteroid(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS, new_type)
+        a1 = Asteroid.spawn(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS, new_type)
         a1.velocity = v1
         
-        a2 = Asteroid(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS, new_type)
+        a2 = Asteroid.spawn(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS, new_type)
         a2.velocity = v2
-        
+
+        # Kill the parent only after both children exist: kill() returns
+        # self to the pool, so killing first lets spawn() hand the parent
+        # back out and reset it while its position/radius are still being
+        # read here (and by the caller after hit() returns)
+        self.kill()
+
         return True  # Asteroid was destroyed
@@ -35,7 +35,7 @@ class AsteroidField(pygame.sprite.Sprite):
         self.speed_multiplier = speed_multiplier  # Store the difficulty speed multiplier
 
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
+        asteroid = Asteroid.spawn(position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt):
@@ -3,6 +3,8 @@ import pygame
 
 # Base class for game objects
 class CircleShape(pygame.sprite.Sprite):
+    __slots__ = ('position', 'velocity', 'radius')
+
     def __init__(self, x, y, radius):
         if hasattr(self, "containers"):
             super().__init__(self.containers)
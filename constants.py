@@ -54,26 +54,28 @@ DIFFICULTY_EASY = 0
 DIFFICULTY_NORMAL = 1
 DIFFICULTY_HARD = 2
 
-# Difficulty modifiers (spawn rate multiplier, asteroid speed multiplier, score multiplier)
+# Difficulty modifier columns
+MOD_SPAWN_RATE = 0  # Spawn rate multiplier (higher number = slower)
+MOD_ASTEROID_SPEED = 1  # Asteroid speed multiplier
+MOD_SCORE = 2  # Score multiplier
+MOD_UFO_SPAWN = 3  # UFO spawn interval multiplier (higher = less frequent)
+
+# Difficulty modifier table, indexed as [difficulty][column]
+DIFFICULTY_MODIFIER_TABLE = (
+    (1.5, 0.7, 0.8, 1.5),  # Easy: slower spawns, slower rocks, lower score, fewer UFOs
+    (1.0, 1.0, 1.0, 1.0),  # Normal
+    (0.6, 1.3, 1.5, 0.7),  # Hard: faster spawns, faster rocks, higher score, more UFOs
+)
+
+# Legacy keyed view of the table, kept for older code paths
 DIFFICULTY_MODIFIERS = {
-    DIFFICULTY_EASY: {
-        'spawn_rate_multiplier': 1.5,  # Slower spawn rate (higher number = slower)
-        'asteroid_speed_multiplier': 0.7,  # Slower asteroids
-        'score_multiplier': 0.8,  # Lower score
-        'ufo_spawn_multiplier': 1.5,  # Less frequent UFOs
-    },
-    DIFFICULTY_NORMAL: {
-        'spawn_rate_multiplier': 1.0,  # Normal spawn rate
-        'asteroid_speed_multiplier': 1.0,  # Normal asteroid speed
-        'score_multiplier': 1.0,  # Normal score
-        'ufo_spawn_multiplier': 1.0,  # Normal UFO frequency
-    },
-    DIFFICULTY_HARD: {
-        'spawn_rate_multiplier': 0.6,  # Faster spawn rate (lower number = faster)
-        'asteroid_speed_multiplier': 1.3,  # Faster asteroids
-        'score_multiplier': 1.5,  # Higher score
-        'ufo_spawn_multiplier': 0.7,  # More frequent UFOs
+    difficulty: {
+        'spawn_rate_multiplier': row[MOD_SPAWN_RATE],
+        'asteroid_speed_multiplier': row[MOD_ASTEROID_SPEED],
+        'score_multiplier': row[MOD_SCORE],
+        'ufo_spawn_multiplier': row[MOD_UFO_SPAWN],
     }
+    for difficulty, row in enumerate(DIFFICULTY_MODIFIER_TABLE)
 }
 
 # Difficulty names for display
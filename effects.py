@@ -2,9 +2,47 @@ import pygame
 import random
 import math
 
+# Module-level bindings so hot loops skip the attribute lookups
+_cos = math.cos
+_sin = math.sin
+_uniform = random.uniform
+_randrange = random.randrange
+_TWO_PI = 2 * math.pi
+
+
+def _update_particles(pos_x, pos_y, vel_x, vel_y, sizes, times, lifetimes,
+                      count, dt, decay, shrink):
+    """Advance every particle by dt and return how many are still alive.
+
+    Kept as a free function over the plain component lists so the hot
+    loop works only on locals; it is also the shape a JIT compiler could
+    take over wholesale if one is ever added to the project.
+    """
+    alive = 0
+    for i in range(count):
+        # Update particle lifetime
+        t = times[i] + dt
+        times[i] = t
+
+        # Skip dead particles
+        if t >= lifetimes[i]:
+            continue
+
+        # Move, slow down, and shrink over time
+        pos_x[i] += vel_x[i] * dt
+        pos_y[i] += vel_y[i] * dt
+        vel_x[i] *= decay
+        vel_y[i] *= decay
+        sizes[i] *= shrink
+        alive += 1
+    return alive
+
 class SpriteAnimation:
     """Handles frame-by-frame sprite animations"""
-    
+
+    __slots__ = ('frames', 'frame_duration', 'current_frame', 'current_time',
+                 'loop', 'finished')
+
     def __init__(self, frames, frame_duration=0.1, loop=True):
         """Initialize with a list of frame surfaces and frame duration in seconds"""
         self.frames = frames
@@ -16,25 +54,23 @@ class SpriteAnimation:
         
     def update(self, dt):
         """Update animation and return the current frame"""
+        frames = self.frames
         if self.finished:
-            return self.frames[-1]
-            
+            return frames[-1]
+
+        # Map total elapsed time straight to a frame index instead of
+        # stepping an accumulator frame by frame
         self.current_time += dt
-        
-        # Check if it's time to advance to the next frame
-        if self.current_time >= self.frame_duration:
-            self.current_frame += 1
-            self.current_time = 0
-            
-            # Check if animation is complete
-            if self.current_frame >= len(self.frames):
-                if self.loop:
-                    self.current_frame = 0  # Loop back to start
-                else:
-                    self.current_frame = len(self.frames) - 1  # Stay on last frame
-                    self.finished = True
-        
-        return self.frames[self.current_frame]
+        frame = int(self.current_time / self.frame_duration)
+        count = len(frames)
+        if self.loop:
+            frame %= count
+        elif frame >= count:
+            frame = count - 1  # Stay on last frame
+            self.finished = True
+        self.current_frame = frame
+
+        return frames[frame]
     
     def reset(self):
         """Reset the animation to the beginning"""
@@ -48,110 +84,151 @@ class SpriteAnimation:
 
 
 class ParticleSystem:
-    """Handles particle effects like explosions, engine trails, etc."""
-    
-    def __init__(self, position, particle_count=20, duration=1.0, colors=None, 
+    """Handles particle effects like explosions, engine trails, etc.
+
+    Particle state lives in parallel per-component lists (a
+    structure-of-arrays layout) instead of one dict per particle, so the
+    per-frame update is a single tight loop over plain floats.
+    """
+
+    __slots__ = ('position', 'duration', 'lifetime', 'decay_rate', 'count',
+                 'pos_x', 'pos_y', 'vel_x', 'vel_y', 'sizes', 'palette',
+                 'color_idx', 'lifetimes', 'times', '_alive')
+
+    # Shared cache of pre-rendered particle circles, keyed by
+    # (color, size, alpha bucket). Alpha fades are quantized to 16 levels
+    # so the whole game reuses a small set of surfaces instead of
+    # allocating one per particle per frame.
+    _sprite_cache = {}
+
+    def __init__(self, position, particle_count=20, duration=1.0, colors=None,
                  size_range=(2, 6), speed_range=(20, 80), decay_rate=0.5):
         self.position = pygame.Vector2(position)
-        self.particles = []
         self.duration = duration
         self.lifetime = 0
-        
+        self.decay_rate = decay_rate
+        self.count = particle_count
+
         # Default particle colors if none provided
         if colors is None:
             colors = [(255, 255, 0), (255, 150, 0), (255, 50, 0)]
-            
-        # Create particles
+
+        # Normalize the palette once; particles store only an index
+        self.palette = tuple(tuple(color[:3]) for color in colors)
+        palette_size = len(self.palette)
+
+        # Create particles as parallel component lists
+        pos_x, pos_y = [], []
+        vel_x, vel_y = [], []
+        sizes, color_idx = [], []
+        lifetimes, times = [], []
+        x, y = self.position.x, self.position.y
+        size_min, size_max = size_range
+        speed_min, speed_max = speed_range
+        min_lifetime = duration * 0.5
         for _ in range(particle_count):
             # Random angle and speed
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(speed_range[0], speed_range[1])
-            
-            # Convert angle to velocity vector
-            velocity = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            
-            # Random size and color
-            size = random.uniform(size_range[0], size_range[1])
-            color = random.choice(colors)
-            
-            # Random lifetime
-            lifetime = random.uniform(duration * 0.5, duration)
-            
-            self.particles.append({
-                'position': pygame.Vector2(position),
-                'velocity': velocity,
-                'color': color,
-                'size': size,
-                'lifetime': lifetime,
-                'current_time': 0,
-                'decay_rate': decay_rate
-            })
-    
+            angle = _uniform(0, _TWO_PI)
+            speed = _uniform(speed_min, speed_max)
+
+            pos_x.append(x)
+            pos_y.append(y)
+            vel_x.append(_cos(angle) * speed)
+            vel_y.append(_sin(angle) * speed)
+            sizes.append(_uniform(size_min, size_max))
+            color_idx.append(_randrange(palette_size))
+            lifetimes.append(_uniform(min_lifetime, duration))
+            times.append(0.0)
+
+        self.pos_x, self.pos_y = pos_x, pos_y
+        self.vel_x, self.vel_y = vel_x, vel_y
+        self.sizes = sizes
+        self.color_idx = color_idx
+        self.lifetimes = lifetimes
+        self.times = times
+        self._alive = particle_count
+
     def update(self, dt):
         """Update all particles"""
         self.lifetime += dt
-        
-        for particle in self.particles:
-            # Update particle lifetime
-            particle['current_time'] += dt
-            
+
+        # Per-system factors, hoisted out of the loop
+        decay = 1 - self.decay_rate * dt
+        shrink = 1 - 0.5 * dt
+
+        self._alive = _update_particles(
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+            self.sizes, self.times, self.lifetimes,
+            self.count, dt, decay, shrink)
+
+    @classmethod
+    def _get_sprite(cls, color, size, alpha_bucket):
+        """Return a cached circle surface for the given color/size/alpha."""
+        key = (color, size, alpha_bucket)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color + (alpha_bucket * 17,), (size, size), size)
+            # Match the display format so blits take the fast path
+            sprite = sprite.convert_alpha()
+            cls._sprite_cache[key] = sprite
+        return sprite
+
+    def append_blits(self, blits):
+        """Append (sprite, position) pairs for all active particles."""
+        pos_x, pos_y = self.pos_x, self.pos_y
+        sizes, color_idx = self.sizes, self.color_idx
+        palette = self.palette
+        times, lifetimes = self.times, self.lifetimes
+        get_sprite = self._get_sprite
+        append = blits.append
+        for i in range(self.count):
             # Skip dead particles
-            if particle['current_time'] >= particle['lifetime']:
+            t = times[i]
+            lifetime = lifetimes[i]
+            if t >= lifetime:
                 continue
-                
-            # Update position
-            particle['position'] += particle['velocity'] * dt
-            
-            # Slow down over time
-            particle['velocity'] *= (1 - particle['decay_rate'] * dt)
-            
-            # Shrink over time
-            life_fraction = particle['current_time'] / particle['lifetime']
-            particle['size'] *= (1 - 0.5 * dt)
-    
+
+            # Calculate alpha (fade out), quantized to the cache buckets
+            alpha_bucket = int(15 * (1 - t / lifetime))
+
+            size = int(sizes[i])
+            sprite = get_sprite(palette[color_idx[i]], size, alpha_bucket)
+            append((sprite, (int(pos_x[i]) - size, int(pos_y[i]) - size)))
+
     def draw(self, screen):
         """Draw all active particles"""
-        for particle in self.particles:
-            # Skip dead particles
-            if particle['current_time'] >= particle['lifetime']:
-                continue
-                
-            # Calculate alpha (fade out)
-            alpha = int(255 * (1 - particle['current_time'] / particle['lifetime']))
-            
-            # Create color with alpha
-            color = particle['color'] + (alpha,)
-            
-            # Draw particle
-            pos = (int(particle['position'].x), int(particle['position'].y))
-            size = int(particle['size'])
-            
-            # Create surface for this particle
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (size, size), size)
-            
-            # Draw particle
-            screen.blit(particle_surf, (pos[0] - size, pos[1] - size))
-    
+        blits = []
+        self.append_blits(blits)
+
+        # Submit all particles in one batched call
+        if blits:
+            screen.blits(blits, doreturn=False)
+
     def is_finished(self):
         """Check if all particles have died"""
-        if self.lifetime >= self.duration:
-            for particle in self.particles:
-                if particle['current_time'] < particle['lifetime']:
-                    return False
-            return True
-        return False
+        return self.lifetime >= self.duration and self._alive == 0
 
 
 class EffectManager:
     """Manages all effects and animations in the game"""
-    
+
+    __slots__ = ('particle_systems', 'animations', '_animation_cache',
+                 '_frames_cache')
+
+    # Scaled/rotated animation frames, shared across managers. Keyed by
+    # the source frame plus quantized scale and angle, so repeated draws
+    # of the same pose reuse one transformed surface.
+    _transform_cache = {}
+
     def __init__(self):
         self.particle_systems = []
         self.animations = {}  # Dictionary of named animations
-        
-        # Cache loaded animations
+
+        # Cache loaded animations, and frame lists by source files so
+        # the same images are never decoded twice under different names
         self._animation_cache = {}
+        self._frames_cache = {}
         
     def add_particle_system(self, position, effect_type="explosion", **kwargs):
         """Add a new particle system at the given position"""
@@ -190,17 +267,22 @@ class EffectManager:
         """Load an animation from files matching a pattern (e.g. 'fire{:02d}.png')"""
         if name in self._animation_cache:
             return self._animation_cache[name]
-            
-        frames = []
-        for i in range(frame_count):
-            try:
-                # Format pattern with frame number
-                filename = pattern.format(i)
-                image = pygame.image.load(filename).convert_alpha()
-                frames.append(image)
-            except pygame.error:
-                print(f"Error loading animation frame: {filename}")
-                
+
+        # Reuse frames already loaded for the same files
+        frames_key = (pattern, frame_count)
+        frames = self._frames_cache.get(frames_key)
+        if frames is None:
+            frames = []
+            for i in range(frame_count):
+                try:
+                    # Format pattern with frame number
+                    filename = pattern.format(i)
+                    image = pygame.image.load(filename).convert_alpha()
+                    frames.append(image)
+                except pygame.error:
+                    print(f"Error loading animation frame: {filename}")
+            self._frames_cache[frames_key] = frames
+
         if not frames:
             print(f"No frames loaded for animation: {name}")
             return None
@@ -236,10 +318,18 @@ class EffectManager:
     
     def update(self, dt):
         """Update all effects and animations"""
-        # Update particle systems and remove finished ones
-        self.particle_systems = [ps for ps in self.particle_systems if not ps.is_finished()]
-        for ps in self.particle_systems:
-            ps.update(dt)
+        # Update particle systems, swap-popping finished ones so the
+        # list is pruned in place without rebuilding it every frame
+        systems = self.particle_systems
+        i = 0
+        while i < len(systems):
+            ps = systems[i]
+            if ps.is_finished():
+                systems[i] = systems[-1]
+                systems.pop()
+            else:
+                ps.update(dt)
+                i += 1
             
         # Update animations and remove finished ones
         finished_anims = []
@@ -253,27 +343,41 @@ class EffectManager:
     
     def draw(self, screen):
         """Draw all effects sorted by layer"""
-        # Draw particle systems
+        # Gather every emitter's particles into one batched submission
+        blits = []
         for ps in self.particle_systems:
-            ps.draw(screen)
+            ps.append_blits(blits)
+        if blits:
+            screen.blits(blits, doreturn=False)
             
         # Sort animations by layer
         sorted_anims = sorted(self.animations.items(), key=lambda x: x[1]['layer'])
         
         # Draw animations
+        transform_cache = EffectManager._transform_cache
         for _, anim_data in sorted_anims:
-            frame = anim_data['animation'].update(0)  # Get current frame without advancing
-            
-            # Scale if needed
-            if anim_data['scale'] != 1.0:
-                orig_size = frame.get_size()
-                new_size = (int(orig_size[0] * anim_data['scale']), int(orig_size[1] * anim_data['scale']))
-                frame = pygame.transform.scale(frame, new_size)
-                
-            # Rotate if needed
-            if anim_data['angle'] != 0:
-                frame = pygame.transform.rotate(frame, -anim_data['angle'])
-                
+            # Read the current frame directly instead of update(0)
+            anim = anim_data['animation']
+            frame = anim.frames[anim.current_frame]
+
+            scale = anim_data['scale']
+            angle = anim_data['angle']
+            if scale != 1.0 or angle != 0:
+                key = (id(frame), round(scale, 2), int(angle))
+                transformed = transform_cache.get(key)
+                if transformed is None:
+                    transformed = frame
+                    # Scale if needed
+                    if scale != 1.0:
+                        orig_size = transformed.get_size()
+                        new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
+                        transformed = pygame.transform.scale(transformed, new_size)
+                    # Rotate if needed
+                    if angle != 0:
+                        transformed = pygame.transform.rotate(transformed, -angle)
+                    transform_cache[key] = transformed
+                frame = transformed
+
             # Draw the frame
             rect = frame.get_rect(center=anim_data['position'])
             screen.blit(frame, rect)
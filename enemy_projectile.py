@@ -7,39 +7,59 @@ class EnemyProjectile(CircleShape):
     """Projectile fired by enemies"""
     # Class sprite variables
     laser_sprite = None
-    
+
+    # Rotated sprite cache, shared by all projectiles. Angles are
+    # bucketed to ROTATION_STEP degrees so every heading maps onto a
+    # small, reusable set of pre-rotated surfaces.
+    ROTATION_STEP = 5
+    _rotation_cache = {}
+
+    # Pre-rendered creation-flash frames, one per fade step. Built
+    # lazily on first draw and shared by all projectiles.
+    _flash_frames = None
+
     def __init__(self, x, y):
         super().__init__(x, y, ENEMY_SHOT_RADIUS)
-        
+
         # Load laser sprite if not already loaded
         if EnemyProjectile.laser_sprite is None:
             EnemyProjectile.laser_sprite = pygame.image.load("assets/images/laserRed.png").convert_alpha()
 
         orig_width, orig_height = EnemyProjectile.laser_sprite.get_size()
         aspect_ratio = orig_width / orig_height
-              
+
         # Scale sprite to match the shot size
-        self.sprite_width = ENEMY_SHOT_RADIUS 
+        self.sprite_width = ENEMY_SHOT_RADIUS
         self.sprite_height =int(self.sprite_width / aspect_ratio)
-        self.sprite = pygame.transform.scale(EnemyProjectile.laser_sprite, 
+        self.sprite = pygame.transform.scale(EnemyProjectile.laser_sprite,
                                            (self.sprite_width, self.sprite_height))
-        
+
         # Track rotation for proper rendering
         self.rotation = 0
-        
+
         # Shot creation effect timer
         self.creation_effect = True
         self.effect_timer = 0.1  # Effect duration in seconds
-        
+
+    def _get_rotated(self, angle):
+        """Return a cached sprite rotated to the nearest angle bucket."""
+        bucket = int(angle // EnemyProjectile.ROTATION_STEP) % (360 // EnemyProjectile.ROTATION_STEP)
+        cache = EnemyProjectile._rotation_cache
+        rotated = cache.get(bucket)
+        if rotated is None:
+            rotated = pygame.transform.rotate(self.sprite, bucket * EnemyProjectile.ROTATION_STEP)
+            cache[bucket] = rotated
+        return rotated
+
     def draw(self, screen):
         """Draw the enemy projectile with sprite and effects"""
         # Calculate rotation based on velocity direction
         if self.velocity.length() > 0:
             # Get angle in degrees, adjusted for pygame's coordinate system
             self.rotation = math.degrees(math.atan2(self.velocity.y, self.velocity.x))
-            
+
         # Rotate the sprite to match the direction of travel
-        rotated_sprite = pygame.transform.rotate(self.sprite, -self.rotation + 90)  # +90 to align properly
+        rotated_sprite = self._get_rotated(-self.rotation + 90)  # +90 to align properly
         sprite_rect = rotated_sprite.get_rect(center=self.position)
         
         # Draw the laser sprite
@@ -47,12 +67,21 @@ class EnemyProjectile(CircleShape):
         
         # Add firing effect when shot is first created
         if self.creation_effect:
-            # Create a bright flash at the center
-            flash_size = self.radius * 4
-            flash_surf = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
-            flash_alpha = int(255 * (self.effect_timer / 0.1))  # Fade out over effect duration
-            pygame.draw.circle(flash_surf, (255, 100, 100, flash_alpha), 
-                             (flash_size, flash_size), flash_size)
+            if EnemyProjectile._flash_frames is None:
+                # Render the fade-out once: six frames from dim to bright
+                flash_size = self.radius * 4
+                frames = []
+                for step in range(6):
+                    flash_surf = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
+                    flash_alpha = int(255 * step / 5)
+                    pygame.draw.circle(flash_surf, (255, 100, 100, flash_alpha),
+                                     (flash_size, flash_size), flash_size)
+                    frames.append(flash_surf.convert_alpha())
+                EnemyProjectile._flash_frames = frames
+
+            # Pick the frame matching the remaining effect time
+            frame_index = min(5, int(self.effect_timer * 50))  # Fade out over effect duration
+            flash_surf = EnemyProjectile._flash_frames[frame_index]
             flash_rect = flash_surf.get_rect(center=self.position)
             screen.blit(flash_surf, flash_rect, special_flags=pygame.BLEND_RGBA_ADD)
         
@@ -66,18 +95,39 @@ class EnemyProjectile(CircleShape):
     
     def update(self, dt):
         """Update the projectile position and effects"""
-        self.position += (self.velocity * dt)
-        
+        # Bind hot attributes once
+        position = self.position
+        velocity = self.velocity
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
+
         # Update firing effect
         if self.creation_effect:
             self.effect_timer -= dt
             if self.effect_timer <= 0:
                 self.creation_effect = False
-        
-        # Remove if off-screen
-        if (self.position.x < -self.radius or 
-            self.position.x > SCREEN_WIDTH + self.radius or
-            self.position.y < -self.radius or
-            self.position.y > SCREEN_HEIGHT + self.radius):
-            self.kill()
+
+    # Screen rectangle inflated by the shot radius, precomputed once;
+    # every projectile shares the same radius
+    _CULL_LEFT = -ENEMY_SHOT_RADIUS
+    _CULL_RIGHT = SCREEN_WIDTH + ENEMY_SHOT_RADIUS
+    _CULL_TOP = -ENEMY_SHOT_RADIUS
+    _CULL_BOTTOM = SCREEN_HEIGHT + ENEMY_SHOT_RADIUS
+
+    @classmethod
+    def cull_offscreen(cls, projectiles,
+                       _left=_CULL_LEFT, _right=_CULL_RIGHT,
+                       _top=_CULL_TOP, _bottom=_CULL_BOTTOM):
+        """Kill every projectile that has left the screen.
+
+        One sweep over the group after the update pass, so the bounds
+        test is a tight loop instead of part of every instance update.
+        The inflated bounds are baked in, and the chained comparisons
+        resolve the common on-screen case in two checks.
+        """
+        for projectile in projectiles:
+            position = projectile.position
+            if not (_left <= position.x <= _right and
+                    _top <= position.y <= _bottom):
+                projectile.kill()
 
@@ -1,17 +1,55 @@
 import pygame
 import json
 import os
+import threading
 import time
 import sys
-from enum import Enum, auto
+from bisect import bisect_right
+from enum import Enum, IntFlag, auto
 from constants import *
 
-# Try to import sound manager without creating circular imports
+# Combo tiers: multiplier jumps at each threshold, looked up by bisecting
+# the thresholds with the current combo count
+_COMBO_THRESHOLDS = (2, 3, 5, 7, 10)
+_COMBO_MULTIPLIERS = (1.0, 1.5, 2.0, 2.5, 3.0, 4.0)
+
+
+# Serializes background saves so overlapping writes can't race on the
+# shared temp file
+_write_lock = threading.Lock()
+
+
+def _atomic_write(path, payload):
+    """Write payload to path via a temp file so readers never see a
+    partial file"""
+    try:
+        with _write_lock:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb', buffering=1 << 16) as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving high scores: {e}")
+
+# Try to import sound manager without creating circular imports; the
+# instance itself is created lazily so importing this module does not
+# pay the mixer/asset start-up cost
 try:
     from sound import SoundManager
-    sound_manager = SoundManager()
 except ImportError:
-    sound_manager = None
+    SoundManager = None
+
+_sound_manager = None
+
+
+def _get_sound_manager():
+    """Return the shared SoundManager, creating it on first use."""
+    global _sound_manager
+    if _sound_manager is None and SoundManager is not None:
+        _sound_manager = SoundManager()
+    return _sound_manager
 
 # Game states
 class GameState(Enum):
@@ -34,15 +72,73 @@ class MenuOption(Enum):
     BACK_TO_MENU = auto()
     RESTART = auto()
 
-# Achievement types
-class Achievement(Enum):
-    FIRST_KILL = auto()       # First asteroid destroyed
-    COMBO_MASTER = auto()     # 5+ combo
-    LEVEL_COMPLETE = auto()   # Complete a level
-    UFO_HUNTER = auto()       # Destroy 5 UFOs
-    SURVIVOR = auto()         # Survive 5 minutes
-    PERFECT_WAVE = auto()     # Complete a wave without taking damage
-    BOSS_SLAYER = auto()      # Defeat a boss wave
+# Achievement types; bit flags so a player's unlocked set packs into one int
+class Achievement(IntFlag):
+    FIRST_KILL = 1            # First asteroid destroyed
+    COMBO_MASTER = 2          # 5+ combo
+    LEVEL_COMPLETE = 4        # Complete a level
+    UFO_HUNTER = 8            # Destroy 5 UFOs
+    SURVIVOR = 16             # Survive 5 minutes
+    PERFECT_WAVE = 32         # Complete a wave without taking damage
+    BOSS_SLAYER = 64          # Defeat a boss wave
+
+# Display names and ready-made popup lines for each achievement
+_ACHIEVEMENT_NAMES = {
+    Achievement.FIRST_KILL: "First Kill",
+    Achievement.COMBO_MASTER: "Combo Master",
+    Achievement.LEVEL_COMPLETE: "Level Complete",
+    Achievement.UFO_HUNTER: "UFO Hunter",
+    Achievement.SURVIVOR: "Survivor",
+    Achievement.PERFECT_WAVE: "Perfect Wave",
+    Achievement.BOSS_SLAYER: "Boss Slayer"
+}
+_ACHIEVEMENT_POPUPS = {a: f"Achievement Unlocked: {name}"
+                       for a, name in _ACHIEVEMENT_NAMES.items()}
+
+# High-score table column centers and the header-line extent, derived
+# from the screen width once instead of per frame
+_HS_COL_X = tuple(k * SCREEN_WIDTH // 5 for k in (1, 2, 3, 4))
+_HS_LINE_START = _HS_COL_X[0] - 100
+_HS_LINE_END = _HS_COL_X[3] + 100
+
+# Static text for the help and credits screens; classified, rendered,
+# and positioned once per GameStateManager instead of per frame
+_HELP_LINES = (
+    "CONTROLS:",
+    "- WASD keys to move your ship",
+    "- SPACE to shoot",
+    "- P or ESC to pause the game",
+    "- M to toggle sound",
+    "",
+    "GAMEPLAY:",
+    "- Destroy asteroids and UFOs to score points",
+    "- Chain multiple hits to build combos and increase score multipliers",
+    "- Collect power-ups to gain advantages",
+    "- Complete waves and levels to progress",
+    "- Each level has multiple waves and increasing difficulty",
+    "- Boss waves appear every 3 levels",
+    "",
+    "POWER-UPS:",
+    "- Ammo: Replenishes your ammunition",
+    "- Rapid Fire: Temporarily increases firing rate",
+    "- Score Boost: Instantly adds points to your score",
+    "- Shield: Temporary invincibility"
+)
+_CREDITS_LINES = (
+    "ASTEROIDS",
+    "A Python Pygame Implementation",
+    "",
+    "",
+    "GRAPHICS:",
+    "Kenney.nl| www.kenney.nl"
+    "",
+    "SOUND EFFECTS:",
+    "Various sound libraries",
+    "",
+    "MUSIC:",
+    "Music Unlimited from Pixabay"
+    "",
+)
 
 class ScoreSystem:
     """Handles score tracking, combos, multipliers, and high scores"""
@@ -60,9 +156,10 @@ class ScoreSystem:
         self.base_multiplier = 1.0
         self.combo_multiplier = 1.0
         self.level_multiplier = 1.0
-        
-        # Achievement tracking
-        self.achievements = set()
+        self._total_multiplier = 1.0
+
+        # Achievement tracking, as a bitmask of Achievement flags
+        self.achievements = 0
         self.achievement_popup_timer = 0
         self.achievement_popup_text = ""
         
@@ -72,14 +169,33 @@ class ScoreSystem:
         self.time_survived = 0
         self.waves_completed = 0
         self.perfect_wave = True  # Reset when taking damage
-        
+        self._survivor_target = 300.0  # Survival threshold; 0 once awarded
+
+        # Rendered HUD text surfaces, keyed by (text, color); font
+        # rasterization only happens when a value actually changes
+        self._hud_cache = {}
+
+        # Composed score block: the three lines are blitted onto one
+        # persistent backbuffer that is rebuilt only when the displayed
+        # values change
+        self._hud_surf = None
+        self._hud_values = None
+
+        # Bound once: either the real play_sound or a no-op
+        sound_manager = _get_sound_manager()
+        self._play = sound_manager.play_sound if sound_manager else (lambda name: None)
+
     def _load_high_scores(self):
         """Load high scores from file"""
         try:
             if os.path.exists('high_scores.json'):
-                with open('high_scores.json', 'r') as f:
-                    data = json.load(f)
-                    return data if data else []
+                # Read the whole file as bytes in one call and decode
+                # from memory, skipping the text-mode decoding layer
+                with open('high_scores.json', 'rb') as f:
+                    data = json.loads(f.read())
+                # Keep the list sorted descending so the best score
+                # is always entry 0 and the worst is entry -1
+                return sorted(data, key=lambda x: x["score"], reverse=True) if data else []
         except Exception as e:
             print(f"Error loading high scores: {e}")
         
@@ -89,19 +205,28 @@ class ScoreSystem:
     def save_high_scores(self):
         """Save high scores to file"""
         try:
-            with open('high_scores.json', 'w') as f:
-                json.dump(self.high_scores, f)
+            # Serialize up front, then hand the disk write to a
+            # background thread so the game-over flow is not blocked
+            payload = json.dumps(self.high_scores).encode('utf-8')
+            threading.Thread(target=_atomic_write,
+                             args=('high_scores.json', payload),
+                             daemon=True).start()
         except Exception as e:
             print(f"Error saving high scores: {e}")
     
+    def _recompute_total(self):
+        """Refresh the cached product of the score multipliers"""
+        self._total_multiplier = self.base_multiplier * self.combo_multiplier * self.level_multiplier
+
     def add_score(self, points, level_multiplier=1.0):
         """Add points to score with multipliers applied"""
         # Apply multipliers
-        self.level_multiplier = level_multiplier
-        total_multiplier = self.base_multiplier * self.combo_multiplier * self.level_multiplier
-        
+        if level_multiplier != self.level_multiplier:
+            self.level_multiplier = level_multiplier
+            self._recompute_total()
+
         # Calculate final score
-        adjusted_score = int(points * total_multiplier)
+        adjusted_score = int(points * self._total_multiplier)
         self.score += adjusted_score
         
         # Update combo
@@ -113,25 +238,21 @@ class ScoreSystem:
             self.max_combo = self.combo_count
         
         # Update combo multiplier (caps at 4x)
-        if self.combo_count >= 10:
-            self.combo_multiplier = 4.0
-        elif self.combo_count >= 7:
-            self.combo_multiplier = 3.0
-        elif self.combo_count >= 5:
-            self.combo_multiplier = 2.5
-            # Award combo achievement
+        self.combo_multiplier = _COMBO_MULTIPLIERS[bisect_right(_COMBO_THRESHOLDS, self.combo_count)]
+        self._recompute_total()
+
+        # Award combo achievement on reaching a 5 combo
+        if self.combo_count == 5:
             self.add_achievement(Achievement.COMBO_MASTER)
-        elif self.combo_count >= 3:
-            self.combo_multiplier = 2.0
-        elif self.combo_count >= 2:
-            self.combo_multiplier = 1.5
-        else:
-            self.combo_multiplier = 1.0
-            
+
         return adjusted_score
     
-    def update(self, dt):
-        """Update combo timer and other time-based elements"""
+    def update_combo(self, dt):
+        """Update the combo and popup timers"""
+        # Nothing to advance on a paused or zero-length frame
+        if dt <= 0.0:
+            return
+
         # Update combo timer
         if self.combo_timer > 0:
             self.combo_timer -= dt
@@ -139,17 +260,29 @@ class ScoreSystem:
                 # Reset combo
                 self.combo_count = 0
                 self.combo_multiplier = 1.0
-        
+                self._recompute_total()
+
         # Update achievement popup timer
         if self.achievement_popup_timer > 0:
             self.achievement_popup_timer -= dt
-        
-        # Update survival time
+
+    def update_survival(self, dt):
+        """Accumulate survival time; only called while a game is running"""
+        # Nothing to advance on a paused or zero-length frame
+        if dt <= 0.0:
+            return
         self.time_survived += dt
-        
-        # Check for time-based achievements
-        if self.time_survived >= 300 and Achievement.SURVIVOR not in self.achievements:  # 5 minutes
+
+        # Check for time-based achievements (5 minutes); one-shot, the
+        # target zeroes out once awarded
+        if self._survivor_target and self.time_survived >= self._survivor_target:
             self.add_achievement(Achievement.SURVIVOR)
+            self._survivor_target = 0.0
+
+    def update(self, dt):
+        """Update combo timer and other time-based elements"""
+        self.update_combo(dt)
+        self.update_survival(dt)
     
     def check_high_score(self):
         """Check if current score qualifies for high score table"""
@@ -164,38 +297,32 @@ class ScoreSystem:
             "date": time.strftime("%Y-%m-%d")
         }
         
-        # Add to list and sort
-        self.high_scores.append(new_entry)
-        self.high_scores.sort(key=lambda x: x["score"], reverse=True)
-        
+        # Insert at the right rank; the list is kept sorted descending
+        new_score = new_entry["score"]
+        for i, entry in enumerate(self.high_scores):
+            if new_score > entry["score"]:
+                self.high_scores.insert(i, new_entry)
+                break
+        else:
+            self.high_scores.append(new_entry)
+
         # Keep only top 10
-        self.high_scores = self.high_scores[:10]
+        del self.high_scores[10:]
         
         # Save updated high scores
         self.save_high_scores()
     
     def add_achievement(self, achievement):
         """Add an achievement and show popup"""
-        if achievement not in self.achievements:
-            self.achievements.add(achievement)
-            
+        if not (self.achievements & achievement):
+            self.achievements |= achievement
+
             # Set achievement popup
-            achievement_names = {
-                Achievement.FIRST_KILL: "First Kill",
-                Achievement.COMBO_MASTER: "Combo Master",
-                Achievement.LEVEL_COMPLETE: "Level Complete",
-                Achievement.UFO_HUNTER: "UFO Hunter",
-                Achievement.SURVIVOR: "Survivor",
-                Achievement.PERFECT_WAVE: "Perfect Wave",
-                Achievement.BOSS_SLAYER: "Boss Slayer"
-            }
-            
-            self.achievement_popup_text = f"Achievement Unlocked: {achievement_names[achievement]}"
+            self.achievement_popup_text = _ACHIEVEMENT_POPUPS[achievement]
             self.achievement_popup_timer = 3.0  # Show for 3 seconds
             
             # Play achievement sound
-            if sound_manager:
-                sound_manager.play_sound('ufo_appear')  # Reuse as achievement sound
+            self._play('ufo_appear')  # Reuse as achievement sound
     
     def reset(self):
         """Reset score system for a new game"""
@@ -206,7 +333,8 @@ class ScoreSystem:
         self.max_combo = 0
         self.base_multiplier = 1.0
         self.level_multiplier = 1.0
-        self.achievements = set()
+        self._total_multiplier = 1.0
+        self.achievements = 0
         self.achievement_popup_timer = 0
         self.achievement_popup_text = ""
         self.asteroids_destroyed = 0
@@ -214,7 +342,11 @@ class ScoreSystem:
         self.time_survived = 0
         self.waves_completed = 0
         self.perfect_wave = True
-    
+        self._survivor_target = 300.0
+        self._hud_cache.clear()
+        self._hud_surf = None
+        self._hud_values = None
+
     def on_asteroid_destroyed(self):
         """Track asteroid destruction for achievements"""
         self.asteroids_destroyed += 1
@@ -256,30 +388,53 @@ class ScoreSystem:
         self.combo_count = 0
         self.combo_multiplier = 1.0
         self.combo_timer = 0
+        self._recompute_total()
     
+    def _render_cached(self, font, text, color):
+        """Render text through the HUD surface cache"""
+        key = (text, color)
+        surface = self._hud_cache.get(key)
+        if surface is None:
+            # Converted so cached blits take the same-format fast path
+            surface = font.render(text, True, color).convert_alpha()
+            self._hud_cache[key] = surface
+        return surface
+
     def draw_score(self, screen, x, y, font):
         """Draw score and multiplier information"""
-        # Draw current score
-        score_text = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        screen.blit(score_text, (x, y))
-        
-        # Draw combo counter if active
-        if self.combo_count > 1:
-            combo_color = (255, 255, 0)  # Yellow for active combo
-            combo_text = font.render(f"Combo: x{self.combo_count} ({self.combo_multiplier:.1f}x)", True, combo_color)
-            screen.blit(combo_text, (x, y + FONT_SIZE))
-        else:
-            # No active combo
-            combo_text = font.render("Combo: -", True, (200, 200, 200))
-            screen.blit(combo_text, (x, y + FONT_SIZE))
-        
-        # Draw total multiplier
-        total_multiplier = self.base_multiplier * self.combo_multiplier * self.level_multiplier
-        mult_text = font.render(f"Multiplier: {total_multiplier:.1f}x", True, (200, 200, 200))
-        screen.blit(mult_text, (x, y + FONT_SIZE * 2))
-        
+        # Compare the raw values first; formatting and composing only
+        # happen when something displayed actually changed, so the
+        # common frame builds no strings at all
+        values = (self.score, self.combo_count, self.combo_multiplier,
+                  self._total_multiplier)
+        if values != self._hud_values:
+            self._hud_values = values
+
+            # Render the score line
+            score_text = self._render_cached(font, f"Score: {self.score}", (255, 255, 255))
+
+            # Render the combo line
+            if self.combo_count > 1:
+                combo_color = (255, 255, 0)  # Yellow for active combo
+                combo_text = self._render_cached(font, f"Combo: x{self.combo_count} ({self.combo_multiplier:.1f}x)", combo_color)
+            else:
+                # No active combo
+                combo_text = self._render_cached(font, "Combo: -", (200, 200, 200))
+
+            # Render the total multiplier line
+            mult_text = self._render_cached(font, f"Multiplier: {self._total_multiplier:.1f}x", (200, 200, 200))
+
+            # Recompose the backbuffer from the three lines
+            lines = (score_text, combo_text, mult_text)
+            width = max(line.get_width() for line in lines)
+            surf = pygame.Surface((width, FONT_SIZE * 3), pygame.SRCALPHA)
+            for i, line in enumerate(lines):
+                surf.blit(line, (0, i * FONT_SIZE))
+            self._hud_surf = surf.convert_alpha()
+        screen.blit(self._hud_surf, (x, y))
+
         return y + FONT_SIZE * 3  # Return next Y position for other HUD elements
-    
+
     def draw_achievement_popup(self, screen, font):
         """Draw achievement popup if active"""
         if self.achievement_popup_timer > 0:
@@ -288,16 +443,16 @@ class ScoreSystem:
             popup_height = 50
             popup_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
             popup_surface.fill((0, 0, 0, 180))
-            
+
             # Position in top-center of screen
             x = (SCREEN_WIDTH - popup_width) // 2
             y = 20
-            
+
             # Draw popup
             screen.blit(popup_surface, (x, y))
-            
+
             # Draw text
-            achievement_text = font.render(self.achievement_popup_text, True, (255, 215, 0))
+            achievement_text = self._render_cached(font, self.achievement_popup_text, (255, 215, 0))
             text_x = x + (popup_width - achievement_text.get_width()) // 2
             text_y = y + (popup_height - achievement_text.get_height()) // 2
             screen.blit(achievement_text, (text_x, text_y))
@@ -308,22 +463,35 @@ class GameStateManager:
         self.screen = screen
         self.current_state = GameState.MENU
         self.score_system = ScoreSystem()
+
+        # Bound once: either the real play_sound or a no-op
+        sound_manager = _get_sound_manager()
+        self._play = sound_manager.play_sound if sound_manager else (lambda name: None)
         
         # UI elements
         self.title_font = pygame.font.SysFont(None, FONT_SIZE * 3)
         self.menu_font = pygame.font.SysFont(None, FONT_SIZE * 2)
         self.font = pygame.font.SysFont(None, FONT_SIZE)
+
+        # Rendered text surfaces keyed by (font, text, color); the
+        # static screens blit cached surfaces instead of re-rasterizing
+        # their strings every frame
+        self._text_cache = {}
+
+        # High-score table rows, re-rendered only when the scoreboard
+        # contents, the current score, or the name-entry state change
+        self._hs_rows = None
+        self._hs_rows_key = None
+
+        # Single-slot memo of the last static screen drawn (help,
+        # credits, high scores), keyed by the view state that affects
+        # it; while the key matches, the frame is replayed in one blit
+        self._frame_key = None
+        self._frame_surf = None
         
         # Menu state
-        self.menu_options = []
         self.selected_option = 0
         
-        # Pause state
-        self.pause_options = []
-        
-        # Game over state
-        self.game_over_options = []
-        
         # High score entry
         self.entering_name = False
         self.player_name = ""
@@ -335,36 +503,104 @@ class GameStateManager:
         self.transition_alpha = 0
         self.transition_speed = 5  # alpha change per frame
         self.transitioning_to = None
-        
+
+        # Menu high-score line, re-rendered only when the value changes
+        self._high_score_value = None
+        self._high_score_surf = None
+
+        # Static screen titles and hint text, rendered once
+        self._title_surf = self.title_font.render("ASTEROIDS", True, (255, 255, 255)).convert_alpha()
+        self._paused_surf = self.title_font.render("PAUSED", True, (255, 255, 255)).convert_alpha()
+        self._game_over_surf = self.title_font.render("GAME OVER", True, (255, 50, 50)).convert_alpha()
+        self._controls_surf = self.font.render("Use UP/DOWN arrows to select, ENTER to confirm", True, (150, 150, 150)).convert_alpha()
+
+        # Full-screen overlays, built once and reused every frame
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        self._game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._game_over_overlay.fill((0, 0, 0, 200))  # More opaque black
+        self._transition_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._transition_overlay.fill((0, 0, 0))
+
         # Initialize menus
         self._init_menus()
+
+        # Pre-classified static screen text, blitted in one batch
+        self._help_blits = self._build_screen_lines(_HELP_LINES, 130, 30)
+        self._credits_blits = self._build_screen_lines(_CREDITS_LINES, 130, 35,
+                                                       title_line="ASTEROIDS")
+
+        # High-score table header strip: the four column headers and
+        # the separator line baked into one surface
+        strip = pygame.Surface((SCREEN_WIDTH, 50), pygame.SRCALPHA)
+        for text, col_x in zip(("Rank", "Name", "Score", "Date"), _HS_COL_X):
+            surf = self._render_cached(self.menu_font, text, (255, 255, 255))[0]
+            strip.blit(surf, (col_x - surf.get_width() // 2, 0))
+        pygame.draw.line(strip, (200, 200, 200), (_HS_LINE_START, 40), (_HS_LINE_END, 40), 2)
+        self._hs_header_strip = strip.convert_alpha()
+
+        # Per-menu dispatch tables: selected option type -> action
+        self._menu_dispatch = {
+            MenuOption.START_GAME: self._action_start_game,
+            MenuOption.HIGH_SCORES: self._action_high_scores,
+            MenuOption.HELP: self._action_help,
+            MenuOption.CREDITS: self._action_credits,
+            MenuOption.QUIT: self._action_quit,
+        }
+        self._pause_dispatch = {
+            MenuOption.RESUME: self._action_resume,
+            MenuOption.RESTART: self._action_restart,
+            MenuOption.BACK_TO_MENU: self._action_back_to_menu,
+            MenuOption.QUIT: self._action_quit,
+        }
+        self._game_over_dispatch = {
+            MenuOption.RESTART: self._action_restart,
+            MenuOption.HIGH_SCORES: self._action_high_scores,
+            MenuOption.BACK_TO_MENU: self._action_back_to_menu_signal,
+            MenuOption.QUIT: self._action_quit_signal,
+        }
     
+    def _build_labels(self, texts):
+        """Pre-render both color variants of each label and its centered
+        x position; the strings never change, so the draw loops can
+        blit directly instead of rasterizing text every frame"""
+        labels = []
+        for text in texts:
+            normal = self.menu_font.render(text, True, (200, 200, 200)).convert_alpha()
+            selected = self.menu_font.render(text, True, (255, 255, 0)).convert_alpha()
+            labels.append((normal, selected, (SCREEN_WIDTH - normal.get_width()) // 2))
+        return tuple(labels)
+
     def _init_menus(self):
         """Initialize menu options for different states"""
+        # Each menu is a pair of parallel tuples: the option types and
+        # their pre-rendered labels, indexed by the selected slot
         # Main menu options
-        self.menu_options = [
-            {"type": MenuOption.START_GAME, "text": "Start Game"},
-            {"type": MenuOption.HIGH_SCORES, "text": "High Scores"},
-            {"type": MenuOption.HELP, "text": "How to Play"},
-            {"type": MenuOption.CREDITS, "text": "Credits"},
-            {"type": MenuOption.QUIT, "text": "Quit Game"}
-        ]
-        
+        self.menu_types = (MenuOption.START_GAME, MenuOption.HIGH_SCORES,
+                           MenuOption.HELP, MenuOption.CREDITS, MenuOption.QUIT)
+        self.menu_labels = self._build_labels(
+            ("Start Game", "High Scores", "How to Play", "Credits", "Quit Game"))
+
         # Pause menu options
-        self.pause_options = [
-            {"type": MenuOption.RESUME, "text": "Resume Game"},
-            {"type": MenuOption.RESTART, "text": "Restart Game"},
-            {"type": MenuOption.BACK_TO_MENU, "text": "Main Menu"},
-            {"type": MenuOption.QUIT, "text": "Quit Game"}
-        ]
-        
+        self.pause_types = (MenuOption.RESUME, MenuOption.RESTART,
+                            MenuOption.BACK_TO_MENU, MenuOption.QUIT)
+        self.pause_labels = self._build_labels(
+            ("Resume Game", "Restart Game", "Main Menu", "Quit Game"))
+
         # Game over menu options
-        self.game_over_options = [
-            {"type": MenuOption.RESTART, "text": "Play Again"},
-            {"type": MenuOption.HIGH_SCORES, "text": "High Scores"},
-            {"type": MenuOption.BACK_TO_MENU, "text": "Main Menu"},
-            {"type": MenuOption.QUIT, "text": "Quit Game"}
-        ]
+        self.game_over_types = (MenuOption.RESTART, MenuOption.HIGH_SCORES,
+                                MenuOption.BACK_TO_MENU, MenuOption.QUIT)
+        self.game_over_labels = self._build_labels(
+            ("Play Again", "High Scores", "Main Menu", "Quit Game"))
+
+        # Selection indicator rasterized once and stamped per slot;
+        # every menu shares the same column and 50px row spacing
+        stamp = pygame.Surface((22, 24), pygame.SRCALPHA)
+        pygame.draw.polygon(stamp, (255, 255, 0), ((0, 12), (20, 2), (20, 22)))
+        self._selector_stamp = stamp.convert_alpha()
+        self._indicator_pos = tuple(
+            (SCREEN_WIDTH // 2 - 150, y)
+            for y in range(250, 250 + 50 * len(self.menu_types), 50))
     
     def change_state(self, new_state):
         """Transition to a new game state"""
@@ -392,8 +628,12 @@ class GameStateManager:
             if self.transition_alpha < 0:
                 self.transition_alpha = 0
         
-        # Update score system
-        self.score_system.update(dt)
+        # Update score system; survival time only accumulates during
+        # actual gameplay, menu screens just keep the timers ticking
+        if self.current_state == GameState.PLAYING:
+            self.score_system.update(dt)
+        else:
+            self.score_system.update_combo(dt)
         
         # Handle name entry cursor blinking
         if self.entering_name:
@@ -428,132 +668,112 @@ class GameStateManager:
             elif self.current_state == GameState.PLAYING:
                 if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                     self.change_state(GameState.PAUSED)
-                    if sound_manager:
-                        sound_manager.play_sound('ufo_appear')
+                    self._play('ufo_appear')
                     return True
         
         return False  # Event not handled
     
+    def _action_start_game(self):
+        """Start a fresh game from the main menu"""
+        self.change_state(GameState.PLAYING)
+        self.score_system.reset()
+        self._play('explosion_large')
+        return True
+
+    def _action_high_scores(self):
+        """Show the high score table"""
+        self.change_state(GameState.HIGH_SCORES)
+        self._play('ufo_appear')
+        return True
+
+    def _action_help(self):
+        """Show the help screen"""
+        self.change_state(GameState.HELP)
+        self._play('ufo_appear')
+        return True
+
+    def _action_credits(self):
+        """Show the credits screen"""
+        self.change_state(GameState.CREDITS)
+        self._play('ufo_appear')
+        return True
+
+    def _action_quit(self):
+        """Quit the game immediately"""
+        pygame.quit()
+        sys.exit()
+
+    def _action_resume(self):
+        """Resume a paused game"""
+        self.change_state(GameState.PLAYING)
+        self._play('phaser')
+        return True
+
+    def _action_restart(self):
+        """Restart gameplay and signal the main loop to rebuild"""
+        self.change_state(GameState.PLAYING)
+        self.score_system.reset()
+        self._play('explosion_large')
+        return {"restart": True}
+
+    def _action_back_to_menu(self):
+        """Return to the main menu"""
+        self.change_state(GameState.MENU)
+        self._play('ufo_appear')
+        return True
+
+    def _action_back_to_menu_signal(self):
+        """Return to the main menu and signal the main loop"""
+        self.change_state(GameState.MENU)
+        self._play('ufo_appear')
+        return {"back_to_menu": True}
+
+    def _action_quit_signal(self):
+        """Signal the main loop to quit"""
+        return {"quit": True}
+
+    def _navigate(self, length, key):
+        """Shared up/down navigation for all menus; True if handled"""
+        if key == pygame.K_UP:
+            self.selected_option = (self.selected_option - 1) % length
+        elif key == pygame.K_DOWN:
+            self.selected_option = (self.selected_option + 1) % length
+        else:
+            return False
+        self._play('shoot')
+        return True
+
     def _handle_menu_input(self, event):
         """Handle input in main menu state"""
-        if event.key == pygame.K_UP:
-            self.selected_option = (self.selected_option - 1) % len(self.menu_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
-            return True
-        elif event.key == pygame.K_DOWN:
-            self.selected_option = (self.selected_option + 1) % len(self.menu_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
+        if self._navigate(len(self.menu_types), event.key):
             return True
         elif event.key == pygame.K_RETURN:
-            option = self.menu_options[self.selected_option]["type"]
-            
-            if option == MenuOption.START_GAME:
-                self.change_state(GameState.PLAYING)
-                self.score_system.reset()
-                if sound_manager:
-                    sound_manager.play_sound('explosion_large')
-            elif option == MenuOption.HIGH_SCORES:
-                self.change_state(GameState.HIGH_SCORES)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-            elif option == MenuOption.HELP:
-                self.change_state(GameState.HELP)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-            elif option == MenuOption.CREDITS:
-                self.change_state(GameState.CREDITS)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-            elif option == MenuOption.QUIT:
-                pygame.quit()
-                sys.exit()
-                return True  
-            
-            return True
-        
+            action = self._menu_dispatch.get(self.menu_types[self.selected_option])
+            return action() if action else True
+
         return False
-    
+
     def _handle_pause_input(self, event):
         """Handle input in pause menu state"""
-        if event.key == pygame.K_UP:
-            self.selected_option = (self.selected_option - 1) % len(self.pause_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
-            return True
-        elif event.key == pygame.K_DOWN:
-            self.selected_option = (self.selected_option + 1) % len(self.pause_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
+        if self._navigate(len(self.pause_types), event.key):
             return True
         elif event.key == pygame.K_RETURN:
-            option = self.pause_options[self.selected_option]["type"]
-            
-            if option == MenuOption.RESUME:
-                self.change_state(GameState.PLAYING)
-                if sound_manager:
-                    sound_manager.play_sound('phaser')
-            elif option == MenuOption.RESTART:
-                self.change_state(GameState.PLAYING)
-                self.score_system.reset()
-                if sound_manager:
-                    sound_manager.play_sound('explosion_large')
-                return {"restart": True}
-            elif option == MenuOption.BACK_TO_MENU:
-                self.change_state(GameState.MENU)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-            elif option == MenuOption.QUIT:
-                pygame.quit()
-                sys.exit()
-                return {"quit": True}  # Signal to quit game
-            
-            return True
+            action = self._pause_dispatch.get(self.pause_types[self.selected_option])
+            return action() if action else True
         elif event.key == pygame.K_ESCAPE:
             # Resume game on Escape
-            self.change_state(GameState.PLAYING)
-            if sound_manager:
-                sound_manager.play_sound('phaser')
-            return True
-        
+            return self._action_resume()
+
         return False
-    
+
     def _handle_game_over_input(self, event):
         """Handle input in game over state"""
-        if event.key == pygame.K_UP:
-            self.selected_option = (self.selected_option - 1) % len(self.game_over_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
-            return True
-        elif event.key == pygame.K_DOWN:
-            self.selected_option = (self.selected_option + 1) % len(self.game_over_options)
-            if sound_manager:
-                sound_manager.play_sound('shoot')
+        if self._navigate(len(self.game_over_types), event.key):
             return True
         elif event.key == pygame.K_RETURN:
-            option = self.game_over_options[self.selected_option]["type"]
-            
-            if option == MenuOption.RESTART:
-                self.change_state(GameState.PLAYING)
-                self.score_system.reset()
-                if sound_manager:
-                    sound_manager.play_sound('explosion_large')
-                return {"restart": True}
-            elif option == MenuOption.HIGH_SCORES:
-                self.change_state(GameState.HIGH_SCORES)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-            elif option == MenuOption.BACK_TO_MENU:
-                self.change_state(GameState.MENU)
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')
-                return {"back_to_menu": True}
-            elif option == MenuOption.QUIT:
-                return {"quit": True}  # Signal to quit game
-            
-            return True
-        
+            action = self._game_over_dispatch.get(self.game_over_types[self.selected_option])
+            return action() if action else True
+
         return False
     
     def _handle_name_entry_input(self, event):
@@ -593,6 +813,47 @@ class GameStateManager:
             self.name_entry_cursor_visible = True
             self.name_entry_cursor_timer = 0
     
+    def _render_cached(self, font, text, color):
+        """Render text through the static-text surface cache.
+
+        Returns (surface, centered_x): the screen-centered x position
+        is computed once and stored with the surface, so centered
+        callers skip the width lookup and arithmetic per frame.
+        """
+        key = (id(font), text, color)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            # Converted so cached blits take the same-format fast path
+            surface = font.render(text, True, color).convert_alpha()
+            entry = (surface, (SCREEN_WIDTH - surface.get_width()) // 2)
+            self._text_cache[key] = entry
+        return entry
+
+    def _build_screen_lines(self, lines, start_y, spacing, title_line=None):
+        """Classify, render, and position a static screen's lines once.
+
+        Returns a list of (surface, (x, y)) pairs ready for a single
+        batched blits call; empty lines only advance the cursor.
+        """
+        blits = []
+        y = start_y
+        for line in lines:
+            if line == "":
+                y += 10  # Add spacing for empty lines
+                continue
+
+            if line == title_line:
+                surf, x = self._render_cached(self.title_font, line, (255, 215, 0))
+            elif ":" in line:
+                # Section headers
+                surf, x = self._render_cached(self.menu_font, line, (255, 215, 0))
+            else:
+                surf, x = self._render_cached(self.font, line, (200, 200, 200))
+
+            blits.append((surf, (x, y)))
+            y += spacing
+        return blits
+
     def draw(self):
         """Draw current state"""
         if self.current_state == GameState.MENU:
@@ -613,49 +874,46 @@ class GameStateManager:
         
         # Draw transition effect if active
         if self.transition_alpha > 0:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(self.transition_alpha)
-            self.screen.blit(overlay, (0, 0))
+            self._transition_overlay.set_alpha(self.transition_alpha)
+            self.screen.blit(self._transition_overlay, (0, 0))
     
     def _draw_menu(self):
         """Draw main menu screen"""
         # Draw title
-        title = self.title_font.render("ASTEROIDS", True, (255, 255, 255))
+        title = self._title_surf
         title_x = (SCREEN_WIDTH - title.get_width()) // 2
         title_y = 100
         self.screen.blit(title, (title_x, title_y))
         
         # Draw menu options
         option_y = 250
-        for i, option in enumerate(self.menu_options):
+        for i, (normal, selected, text_x) in enumerate(self.menu_labels):
             # Highlight selected option
             if i == self.selected_option:
-                color = (255, 255, 0)  # Yellow for selected
-                # Draw selection indicator
-                pygame.draw.polygon(self.screen, color, [
-                    (SCREEN_WIDTH // 2 - 150, option_y + 12),
-                    (SCREEN_WIDTH // 2 - 130, option_y + 2),
-                    (SCREEN_WIDTH // 2 - 130, option_y + 22)
-                ])
+                # Stamp the selection indicator
+                self.screen.blit(self._selector_stamp, self._indicator_pos[i])
+                text = selected
             else:
-                color = (200, 200, 200)  # Gray for unselected
-            
+                text = normal
+
             # Draw option text
-            text = self.menu_font.render(option["text"], True, color)
-            text_x = (SCREEN_WIDTH - text.get_width()) // 2
             self.screen.blit(text, (text_x, option_y))
             option_y += 50
         
         # Draw controls
-        controls_text = self.font.render("Use UP/DOWN arrows to select, ENTER to confirm", True, (150, 150, 150))
+        controls_text = self._controls_surf
         controls_x = (SCREEN_WIDTH - controls_text.get_width()) // 2
         controls_y = SCREEN_HEIGHT - 100
         self.screen.blit(controls_text, (controls_x, controls_y))
         
-        # Draw high score
-        high_score = max([score["score"] for score in self.score_system.high_scores]) if self.score_system.high_scores else 0
-        high_score_text = self.font.render(f"High Score: {high_score}", True, (255, 215, 0))
+        # Draw high score; the list is sorted descending, so the best
+        # score is the first entry
+        high_scores = self.score_system.high_scores
+        high_score = high_scores[0]["score"] if high_scores else 0
+        if high_score != self._high_score_value:
+            self._high_score_value = high_score
+            self._high_score_surf = self.font.render(f"High Score: {high_score}", True, (255, 215, 0))
+        high_score_text = self._high_score_surf
         high_score_x = (SCREEN_WIDTH - high_score_text.get_width()) // 2
         high_score_y = SCREEN_HEIGHT - 50
         self.screen.blit(high_score_text, (high_score_x, high_score_y))
@@ -663,34 +921,26 @@ class GameStateManager:
     def _draw_pause_menu(self):
         """Draw pause menu overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Draw title
-        title = self.title_font.render("PAUSED", True, (255, 255, 255))
+        title = self._paused_surf
         title_x = (SCREEN_WIDTH - title.get_width()) // 2
         title_y = 100
         self.screen.blit(title, (title_x, title_y))
         
         # Draw menu options
         option_y = 250
-        for i, option in enumerate(self.pause_options):
+        for i, (normal, selected, text_x) in enumerate(self.pause_labels):
             # Highlight selected option
             if i == self.selected_option:
-                color = (255, 255, 0)  # Yellow for selected
-                # Draw selection indicator
-                pygame.draw.polygon(self.screen, color, [
-                    (SCREEN_WIDTH // 2 - 150, option_y + 12),
-                    (SCREEN_WIDTH // 2 - 130, option_y + 2),
-                    (SCREEN_WIDTH // 2 - 130, option_y + 22)
-                ])
+                # Stamp the selection indicator
+                self.screen.blit(self._selector_stamp, self._indicator_pos[i])
+                text = selected
             else:
-                color = (200, 200, 200)  # Gray for unselected
-            
+                text = normal
+
             # Draw option text
-            text = self.menu_font.render(option["text"], True, color)
-            text_x = (SCREEN_WIDTH - text.get_width()) // 2
             self.screen.blit(text, (text_x, option_y))
             option_y += 50
         
@@ -703,12 +953,10 @@ class GameStateManager:
     def _draw_game_over(self):
         """Draw game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # More opaque black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
         
         # Draw title
-        title = self.title_font.render("GAME OVER", True, (255, 50, 50))
+        title = self._game_over_surf
         title_x = (SCREEN_WIDTH - title.get_width()) // 2
         title_y = 100
         self.screen.blit(title, (title_x, title_y))
@@ -752,22 +1000,16 @@ class GameStateManager:
         else:
             # Draw menu options
             option_y = 250
-            for i, option in enumerate(self.game_over_options):
+            for i, (normal, selected, text_x) in enumerate(self.game_over_labels):
                 # Highlight selected option
                 if i == self.selected_option:
-                    color = (255, 255, 0)  # Yellow for selected
-                    # Draw selection indicator
-                    pygame.draw.polygon(self.screen, color, [
-                        (SCREEN_WIDTH // 2 - 150, option_y + 12),
-                        (SCREEN_WIDTH // 2 - 130, option_y + 2),
-                        (SCREEN_WIDTH // 2 - 130, option_y + 22)
-                    ])
+                    # Stamp the selection indicator
+                    self.screen.blit(self._selector_stamp, self._indicator_pos[i])
+                    text = selected
                 else:
-                    color = (200, 200, 200)  # Gray for unselected
-                
+                    text = normal
+
                 # Draw option text
-                text = self.menu_font.render(option["text"], True, color)
-                text_x = (SCREEN_WIDTH - text.get_width()) // 2
                 self.screen.blit(text, (text_x, option_y))
                 option_y += 50
             
@@ -795,216 +1037,118 @@ class GameStateManager:
     
     def _draw_high_scores(self):
         """Draw high score table"""
+        # Replay the memoized frame while nothing on it has changed
+        top_scores = self.score_system.high_scores[:10]
+        content_key = (tuple((s["name"], s["score"], s["date"]) for s in top_scores),
+                       self.score_system.score, self.entering_name)
+        frame_key = ("scores", content_key)
+        if frame_key == self._frame_key:
+            self.screen.blit(self._frame_surf, (0, 0))
+            return
+
         # Draw title
-        title = self.title_font.render("HIGH SCORES", True, (255, 215, 0))
-        title_x = (SCREEN_WIDTH - title.get_width()) // 2
+        title, title_x = self._render_cached(self.title_font, "HIGH SCORES", (255, 215, 0))
         title_y = 50
         self.screen.blit(title, (title_x, title_y))
         
         # Check if there are no high scores
         if not self.score_system.high_scores:
-            no_scores_text = self.menu_font.render("No scores recorded yet", True, (200, 200, 200))
-            text_x = (SCREEN_WIDTH - no_scores_text.get_width()) // 2
+            no_scores_text, text_x = self._render_cached(self.menu_font, "No scores recorded yet", (200, 200, 200))
             text_y = SCREEN_HEIGHT // 2 - no_scores_text.get_height() // 2
             self.screen.blit(no_scores_text, (text_x, text_y))
         else:
-            # Draw headers
+            # Draw the baked header strip (column titles + separator)
             header_y = 150
-            rank_header = self.menu_font.render("Rank", True, (255, 255, 255))
-            name_header = self.menu_font.render("Name", True, (255, 255, 255))
-            score_header = self.menu_font.render("Score", True, (255, 255, 255))
-            date_header = self.menu_font.render("Date", True, (255, 255, 255))
-            
-            self.screen.blit(rank_header, (SCREEN_WIDTH // 5 - rank_header.get_width() // 2, header_y))
-            self.screen.blit(name_header, (2 * SCREEN_WIDTH // 5 - name_header.get_width() // 2, header_y))
-            self.screen.blit(score_header, (3 * SCREEN_WIDTH // 5 - score_header.get_width() // 2, header_y))
-            self.screen.blit(date_header, (4 * SCREEN_WIDTH // 5 - date_header.get_width() // 2, header_y))
-            
-            # Draw horizontal line
-            pygame.draw.line(self.screen, (200, 200, 200), (SCREEN_WIDTH // 5 - 100, header_y + 40), (4 * SCREEN_WIDTH // 5 + 100, header_y + 40), 2)
+            self.screen.blit(self._hs_header_strip, (0, header_y))
             
+            # Re-render and re-position the row surfaces only when the
+            # table contents or the highlight state actually changed;
+            # the cached list carries final coordinates, so drawing is
+            # one batched call with no width lookups
+            if content_key != self._hs_rows_key:
+                self._hs_rows_key = content_key
+                row_blits = []
+                score_y = header_y + 60
+                for i, score in enumerate(top_scores):
+                    # Alternate row colors for readability
+                    if i % 2 == 0:
+                        row_color = (200, 200, 200)
+                    else:
+                        row_color = (170, 170, 170)
+
+                    # Highlight if current score
+                    if self.score_system.score == score["score"] and not self.entering_name:
+                        row_color = (255, 255, 0)
+
+                    columns = (
+                        self._render_cached(self.font, f"{i+1}", row_color)[0],
+                        self._render_cached(self.font, score["name"], row_color)[0],
+                        self._render_cached(self.font, f"{score['score']}", row_color)[0],
+                        self._render_cached(self.font, score["date"], row_color)[0],
+                    )
+                    row_blits.extend(
+                        (surf, (col_x - surf.get_width() // 2, score_y))
+                        for surf, col_x in zip(columns, _HS_COL_X))
+                    score_y += 35
+                self._hs_rows = row_blits
+
             # Draw scores
-            score_y = header_y + 60
-            for i, score in enumerate(self.score_system.high_scores[:10]):
-                # Alternate row colors for readability
-                if i % 2 == 0:
-                    row_color = (200, 200, 200)
-                else:
-                    row_color = (170, 170, 170)
-                
-                # Highlight if current score
-                if self.score_system.score == score["score"] and not self.entering_name:
-                    row_color = (255, 255, 0)
-                
-                rank_text = self.font.render(f"{i+1}", True, row_color)
-                name_text = self.font.render(score["name"], True, row_color)
-                score_text = self.font.render(f"{score['score']}", True, row_color)
-                date_text = self.font.render(score["date"], True, row_color)
-                
-                self.screen.blit(rank_text, (SCREEN_WIDTH // 5 - rank_text.get_width() // 2, score_y))
-                self.screen.blit(name_text, (2 * SCREEN_WIDTH // 5 - name_text.get_width() // 2, score_y))
-                self.screen.blit(score_text, (3 * SCREEN_WIDTH // 5 - score_text.get_width() // 2, score_y))
-                self.screen.blit(date_text, (4 * SCREEN_WIDTH // 5 - date_text.get_width() // 2, score_y))
-                
-                score_y += 35
-        
-        # Draw instructions
-        instructions = self.font.render("Press ESC or ENTER to return to menu", True, (150, 150, 150))
-        instructions_x = (SCREEN_WIDTH - instructions.get_width()) // 2
-        instructions_y = SCREEN_HEIGHT - 50
-        self.screen.blit(instructions, (instructions_x, instructions_y))
-        """Draw high score table"""
-        # Draw title
-        title = self.title_font.render("HIGH SCORES", True, (255, 215, 0))
-        title_x = (SCREEN_WIDTH - title.get_width()) // 2
-        title_y = 50
-        self.screen.blit(title, (title_x, title_y))
-        
-        # Draw headers
-        header_y = 150
-        rank_header = self.menu_font.render("Rank", True, (255, 255, 255))
-        name_header = self.menu_font.render("Name", True, (255, 255, 255))
-        score_header = self.menu_font.render("Score", True, (255, 255, 255))
-        date_header = self.menu_font.render("Date", True, (255, 255, 255))
-        
-        self.screen.blit(rank_header, (SCREEN_WIDTH // 5 - rank_header.get_width() // 2, header_y))
-        self.screen.blit(name_header, (2 * SCREEN_WIDTH // 5 - name_header.get_width() // 2, header_y))
-        self.screen.blit(score_header, (3 * SCREEN_WIDTH // 5 - score_header.get_width() // 2, header_y))
-        self.screen.blit(date_header, (4 * SCREEN_WIDTH // 5 - date_header.get_width() // 2, header_y))
-        
-        # Draw horizontal line
-        pygame.draw.line(self.screen, (200, 200, 200), (SCREEN_WIDTH // 5 - 100, header_y + 40), (4 * SCREEN_WIDTH // 5 + 100, header_y + 40), 2)
-        
-        # Draw scores
-        score_y = header_y + 60
-        for i, score in enumerate(self.score_system.high_scores[:10]):
-            # Alternate row colors for readability
-            if i % 2 == 0:
-                row_color = (200, 200, 200)  # Light gray
-            else:
-                row_color = (170, 170, 170)  # Darker gray
-            
-            # Highlight if current score
-            if self.score_system.score == score["score"] and not self.entering_name:
-                row_color = (255, 255, 0)  # Yellow for current score
-            
-            rank_text = self.font.render(f"{i+1}", True, row_color)
-            name_text = self.font.render(score["name"], True, row_color)
-            score_text = self.font.render(f"{score['score']}", True, row_color)
-            date_text = self.font.render(score["date"], True, row_color)
-            
-            self.screen.blit(rank_text, (SCREEN_WIDTH // 5 - rank_text.get_width() // 2, score_y))
-            self.screen.blit(name_text, (2 * SCREEN_WIDTH // 5 - name_text.get_width() // 2, score_y))
-            self.screen.blit(score_text, (3 * SCREEN_WIDTH // 5 - score_text.get_width() // 2, score_y))
-            self.screen.blit(date_text, (4 * SCREEN_WIDTH // 5 - date_text.get_width() // 2, score_y))
-            
-            score_y += 35
+            self.screen.blits(self._hs_rows, doreturn=False)
         
         # Draw instructions
-        instructions = self.font.render("Press ESC or ENTER to return to menu", True, (150, 150, 150))
-        instructions_x = (SCREEN_WIDTH - instructions.get_width()) // 2
+        instructions, instructions_x = self._render_cached(self.font, "Press ESC or ENTER to return to menu", (150, 150, 150))
         instructions_y = SCREEN_HEIGHT - 50
         self.screen.blit(instructions, (instructions_x, instructions_y))
+
+        # Memoize the finished frame for the following frames
+        self._frame_key = frame_key
+        self._frame_surf = self.screen.copy()
     
     def _draw_help(self):
         """Draw help/instructions screen"""
+        # The screen is fully static; replay the memoized frame
+        if self._frame_key == ("help",):
+            self.screen.blit(self._frame_surf, (0, 0))
+            return
+
         # Draw title
-        title = self.title_font.render("HOW TO PLAY", True, (255, 255, 255))
-        title_x = (SCREEN_WIDTH - title.get_width()) // 2
+        title, title_x = self._render_cached(self.title_font, "HOW TO PLAY", (255, 255, 255))
         title_y = 50
         self.screen.blit(title, (title_x, title_y))
         
-        # Draw instructions
-        instructions = [
-            "CONTROLS:",
-            "- WASD keys to move your ship",
-            "- SPACE to shoot",
-            "- P or ESC to pause the game",
-            "- M to toggle sound",
-            "",
-            "GAMEPLAY:",
-            "- Destroy asteroids and UFOs to score points",
-            "- Chain multiple hits to build combos and increase score multipliers",
-            "- Collect power-ups to gain advantages",
-            "- Complete waves and levels to progress",
-            "- Each level has multiple waves and increasing difficulty",
-            "- Boss waves appear every 3 levels",
-            "",
-            "POWER-UPS:",
-            "- Ammo: Replenishes your ammunition",
-            "- Rapid Fire: Temporarily increases firing rate",
-            "- Score Boost: Instantly adds points to your score",
-            "- Shield: Temporary invincibility"
-        ]
-        
-        instruction_y = 130
-        for line in instructions:
-            if line == "":
-                instruction_y += 10  # Add spacing for empty lines
-                continue
-                
-            if ":" in line:
-                # Section headers
-                text = self.menu_font.render(line, True, (255, 215, 0))
-            else:
-                text = self.font.render(line, True, (200, 200, 200))
-                
-            text_x = SCREEN_WIDTH // 2 - text.get_width() // 2
-            self.screen.blit(text, (text_x, instruction_y))
-            instruction_y += 30
+        # Draw the pre-classified instruction lines in one batch
+        self.screen.blits(self._help_blits, doreturn=False)
         
         # Draw instructions to return
-        back_text = self.font.render("Press ESC or ENTER to return to menu", True, (150, 150, 150))
-        back_x = (SCREEN_WIDTH - back_text.get_width()) // 2
+        back_text, back_x = self._render_cached(self.font, "Press ESC or ENTER to return to menu", (150, 150, 150))
         back_y = SCREEN_HEIGHT - 50
         self.screen.blit(back_text, (back_x, back_y))
+
+        # Memoize the finished frame for the following frames
+        self._frame_key = ("help",)
+        self._frame_surf = self.screen.copy()
     
     def _draw_credits(self):
         """Draw credits screen"""
+        # The screen is fully static; replay the memoized frame
+        if self._frame_key == ("credits",):
+            self.screen.blit(self._frame_surf, (0, 0))
+            return
+
         # Draw title
-        title = self.title_font.render("CREDITS", True, (255, 255, 255))
-        title_x = (SCREEN_WIDTH - title.get_width()) // 2
+        title, title_x = self._render_cached(self.title_font, "CREDITS", (255, 255, 255))
         title_y = 50
         self.screen.blit(title, (title_x, title_y))
         
-        # Draw credits text
-        credits = [
-            "ASTEROIDS",
-            "A Python Pygame Implementation",
-            "",
-            "",
-            "GRAPHICS:",
-            "Kenney.nl| www.kenney.nl"
-            "",
-            "SOUND EFFECTS:",
-            "Various sound libraries",
-            "",
-            "MUSIC:",
-            "Music Unlimited from Pixabay"
-            "",
-                            ]
-        
-        credit_y = 130
-        for line in credits:
-            if line == "":
-                credit_y += 10  # Add spacing for empty lines
-                continue
-                
-            if line == "ASTEROIDS":
-                text = self.title_font.render(line, True, (255, 215, 0))
-            elif ":" in line:
-                # Section headers
-                text = self.menu_font.render(line, True, (255, 215, 0))
-            else:
-                text = self.font.render(line, True, (200, 200, 200))
-                
-            text_x = SCREEN_WIDTH // 2 - text.get_width() // 2
-            self.screen.blit(text, (text_x, credit_y))
-            credit_y += 35
+        # Draw the pre-classified credit lines in one batch
+        self.screen.blits(self._credits_blits, doreturn=False)
         
         # Draw instructions to return
-        back_text = self.font.render("Press ESC or ENTER to return to menu", True, (150, 150, 150))
-        back_x = (SCREEN_WIDTH - back_text.get_width()) // 2
+        back_text, back_x = self._render_cached(self.font, "Press ESC or ENTER to return to menu", (150, 150, 150))
         back_y = SCREEN_HEIGHT - 50
         self.screen.blit(back_text, (back_x, back_y))
 
+        # Memoize the finished frame for the following frames
+        self._frame_key = ("credits",)
+        self._frame_surf = self.screen.copy()
+
@@ -1,7 +1,19 @@
 import pygame
 import math
+from functools import lru_cache
 from constants import *
 
+
+@lru_cache(maxsize=2048)
+def _render_text(font, text, color):
+    """Rasterize text once per (font, text, color) combination.
+
+    LRU-bounded rather than an open dict because the animated score
+    sweeps through many intermediate values.
+    """
+    # Match the display format so cached blits take the fast path
+    return font.render(text, True, color).convert_alpha()
+
 class GameHUD:
     """Modern game heads-up display (HUD) with animated elements and visual styling"""
     
@@ -11,7 +23,7 @@ class GameHUD:
         
         # Load HUD assets
         self.life_icon = pygame.image.load("assets/images/life.png").convert_alpha()
-        self.life_icon = pygame.transform.scale(self.life_icon, (30, 30))
+        self.life_icon = pygame.transform.scale(self.life_icon, (30, 30)).convert_alpha()
         
         # Font setup
         self.title_font = pygame.font.Font(None, 48)
@@ -24,6 +36,18 @@ class GameHUD:
         self.target_score = 0   # Target score to animate to
         self.score_change_time = 0  # Time when score last changed
         
+        # Panel backgrounds with border and title baked in, keyed by
+        # (width, height, title); built on first use, blitted after
+        self._panel_cache = {}
+
+        # Darkened bar-background colors, derived once per border color
+        self._dark_border_cache = {}
+
+        # Full-width gradient strips keyed by (width, height, start
+        # color, end color); partial fills blit a sub-area of the
+        # cached strip instead of rebuilding the gradient
+        self._gradient_cache = {}
+
         # Power-up display data
         self.powerup_icons = {
             POWERUP_AMMO: self._create_powerup_icon((50, 200, 50), "A"),
@@ -31,6 +55,26 @@ class GameHUD:
             POWERUP_SCORE: self._create_powerup_icon((200, 50, 200), "S"),
             POWERUP_INVINCIBILITY: self._create_powerup_icon((50, 50, 200), "I"),
         }
+
+        # Timer-bar maximum per power-up type; a lookup table instead
+        # of a branch chain in the draw loop
+        self._powerup_max_time = {
+            POWERUP_FIRE_RATE: POWERUP_FIRE_RATE_DURATION,
+            POWERUP_INVINCIBILITY: POWERUP_INVINCIBILITY_DURATION,
+        }
+
+        # Pre-built power-up timer bar pieces: a backplate holding the
+        # dark background and border, and the full gradient strip that
+        # partial fills area-blit from; both go through the batched
+        # blit list instead of per-bar draw calls
+        self._powerup_bar_back = pygame.Surface((30, 8))
+        self._powerup_bar_back.fill((150, 150, 150))
+        pygame.draw.rect(self._powerup_bar_back, (200, 200, 200), (0, 0, 30, 8), 2)
+        self._powerup_bar_back = self._powerup_bar_back.convert()
+        seed = pygame.Surface((2, 1))
+        seed.set_at((0, 0), (200, 200, 50))
+        seed.set_at((1, 0), (50, 200, 50))
+        self._powerup_bar_grad = pygame.transform.smoothscale(seed, (26, 4)).convert()
     
     def _create_powerup_icon(self, color, letter):
         """Create a colored icon surface for power-ups"""
@@ -45,62 +89,78 @@ class GameHUD:
         text_rect = text.get_rect(center=(icon_size//2, icon_size//2))
         icon.blit(text, text_rect)
         
-        return icon
+        # Match the display format so cached blits take the fast path
+        return icon.convert_alpha()
     
-    def _draw_panel(self, screen, x, y, width, height, title=None):
-        """Draw a semi-transparent panel with optional title"""
-        # Create panel surface
+    def _make_panel(self, width, height, title):
+        """Bake a panel background, border, and title into one surface"""
         panel = pygame.Surface((width, height), pygame.SRCALPHA)
         panel.fill((20, 20, 30, 180))  # Dark blue semi-transparent
-        
+
         # Add border
         pygame.draw.rect(panel, (100, 100, 150, 200), (0, 0, width, height), 2)
-        
-        # Draw panel
-        screen.blit(panel, (x, y))
-        
-        # Draw title if provided
+
+        # Bake title if provided
         if title:
             title_text = self.font.render(title, True, (200, 200, 255))
-            title_rect = title_text.get_rect(midtop=(x + width//2, y + 5))
-            screen.blit(title_text, title_rect)
-            
-        return y + (25 if title else 0)  # Return new Y position after title
+            title_rect = title_text.get_rect(midtop=(width // 2, 5))
+            panel.blit(title_text, title_rect)
+
+        # Match the display format so cached blits take the fast path
+        return panel.convert_alpha()
+
+    def _draw_panel(self, screen, x, y, width, height, title=None):
+        """Draw a semi-transparent panel with optional title"""
+        # The panels never change, so each is baked once and stored
+        # with its content offset
+        key = (width, height, title)
+        entry = self._panel_cache.get(key)
+        if entry is None:
+            entry = (self._make_panel(width, height, title), 25 if title else 0)
+            self._panel_cache[key] = entry
+        panel, title_offset = entry
+        screen.blit(panel, (x, y))
+
+        return y + title_offset  # Return new Y position after title
     
     def _draw_gradient_bar(self, screen, x, y, width, height, value, max_value, 
                           start_color, end_color, border_color=(200, 200, 200), 
                           text=None):
         """Draw a gradient-filled progress bar"""
-        # Background (darker version of border)
-        dark_border = tuple(max(c - 50, 0) for c in border_color)
+        # Background (darker version of border), derived once per color
+        dark_border = self._dark_border_cache.get(border_color)
+        if dark_border is None:
+            dark_border = tuple(max(c - 50, 0) for c in border_color)
+            self._dark_border_cache[border_color] = dark_border
         pygame.draw.rect(screen, dark_border, (x, y, width, height))
         
         # Calculate fill width
         fill_width = int((value / max_value) * (width - 4))
-        
+
         if fill_width > 0:
-            # Create gradient
-            bar_surf = pygame.Surface((fill_width, height - 4))
-            
-            for i in range(fill_width):
-                # Calculate gradient color
-                progress = i / fill_width
-                r = int(start_color[0] + (end_color[0] - start_color[0]) * progress)
-                g = int(start_color[1] + (end_color[1] - start_color[1]) * progress)
-                b = int(start_color[2] + (end_color[2] - start_color[2]) * progress)
-                
-                # Draw vertical line of the gradient
-                pygame.draw.line(bar_surf, (r, g, b), (i, 0), (i, height - 4))
-            
-            # Apply the gradient surface
-            screen.blit(bar_surf, (x + 2, y + 2))
+            # Build the full-width gradient once per bar geometry and
+            # color pair, then blit the filled portion of it
+            key = (width - 4, height - 4, start_color, end_color)
+            bar_surf = self._gradient_cache.get(key)
+            if bar_surf is None:
+                # Let smoothscale interpolate the colors in C: stretch a
+                # two-pixel strip holding the end colors across the bar
+                seed = pygame.Surface((2, 1))
+                seed.set_at((0, 0), start_color)
+                seed.set_at((1, 0), end_color)
+                bar_surf = pygame.transform.smoothscale(seed, (width - 4, height - 4)).convert()
+                self._gradient_cache[key] = bar_surf
+
+            # Apply the filled sub-area of the cached gradient
+            screen.blit(bar_surf, (x + 2, y + 2),
+                        area=pygame.Rect(0, 0, fill_width, height - 4))
         
         # Border
         pygame.draw.rect(screen, border_color, (x, y, width, height), 2)
         
         # Text overlay
         if text:
-            text_surf = self.small_font.render(text, True, (255, 255, 255))
+            text_surf = _render_text(self.small_font, text, (255, 255, 255))
             text_rect = text_surf.get_rect(center=(x + width//2, y + height//2))
             screen.blit(text_surf, text_rect)
     
@@ -128,6 +188,11 @@ class GameHUD:
     
     def draw(self, screen, player, score_system):
         """Draw the full game HUD"""
+        # Text and icon blits are collected here and submitted in one
+        # batched blits call at the end of the frame; the panels and
+        # bars still draw immediately since they sit underneath
+        blit_list = []
+
         # Left panel - Score and game info
         panel_left_width = 250
         panel_left_height = 150
@@ -137,18 +202,18 @@ class GameHUD:
         content_y = self._draw_panel(screen, left_x, left_y, panel_left_width, panel_left_height, "GAME INFO")
         
         # Score with animated value
-        score_text = self.large_font.render(f"{int(self.score_display)}", True, (255, 255, 100))
+        score_text = _render_text(self.large_font, f"{int(self.score_display)}", (255, 255, 100))
         score_rect = score_text.get_rect(midtop=(left_x + panel_left_width//2, content_y + 5))
-        screen.blit(score_text, score_rect)
+        blit_list.append((score_text, score_rect))
         
         # Level info
-        level_text = self.font.render(f"LEVEL: {1}", True, (200, 200, 255))  # Replace with actual level
-        screen.blit(level_text, (left_x + 15, content_y + 45))
+        level_text = _render_text(self.font, f"LEVEL: {1}", (200, 200, 255))  # Replace with actual level
+        blit_list.append((level_text, (left_x + 15, content_y + 45)))
         
         # Combo display
         if score_system.combo_count > 1:
-            combo_text = self.font.render(f"COMBO: x{score_system.combo_count}", True, (255, 200, 50))
-            screen.blit(combo_text, (left_x + 15, content_y + 70))
+            combo_text = _render_text(self.font, f"COMBO: x{score_system.combo_count}", (255, 200, 50))
+            blit_list.append((combo_text, (left_x + 15, content_y + 70)))
             
             # Combo timer bar
             combo_width = panel_left_width - 30
@@ -167,16 +232,16 @@ class GameHUD:
         content_y = self._draw_panel(screen, right_x, right_y, panel_right_width, panel_right_height, "PLAYER")
         
         # Lives display with icons
-        lives_text = self.font.render("LIVES:", True, (200, 200, 255))
-        screen.blit(lives_text, (right_x + 15, content_y + 5))
+        lives_text = _render_text(self.font, "LIVES:", (200, 200, 255))
+        blit_list.append((lives_text, (right_x + 15, content_y + 5)))
         
         # Life icons
-        for i in range(player.lives):
-            screen.blit(self.life_icon, (right_x + 80 + i * 35, content_y))
+        blit_list.extend((self.life_icon, (right_x + 80 + i * 35, content_y))
+                         for i in range(player.lives))
             
         # Health bar
-        health_text = self.font.render(f"HEALTH: {int(player.health)}/{PLAYER_MAX_HEALTH}", True, (200, 200, 255))
-        screen.blit(health_text, (right_x + 15, content_y + 40))
+        health_text = _render_text(self.font, f"HEALTH: {int(player.health)}/{PLAYER_MAX_HEALTH}", (200, 200, 255))
+        blit_list.append((health_text, (right_x + 15, content_y + 40)))
         
         # Gradient health bar: red when low, yellow in middle, green when high
         self._draw_gradient_bar(
@@ -186,8 +251,8 @@ class GameHUD:
         )
         
         # Ammo counter
-        ammo_text = self.font.render(f"AMMO: {player.current_ammo}/{AMMO_MAX_SHOTS}", True, (200, 200, 255))
-        screen.blit(ammo_text, (right_x + 15, content_y + 95))
+        ammo_text = _render_text(self.font, f"AMMO: {player.current_ammo}/{AMMO_MAX_SHOTS}", (200, 200, 255))
+        blit_list.append((ammo_text, (right_x + 15, content_y + 95)))
         
         # Ammo bar
         self._draw_gradient_bar(
@@ -211,24 +276,26 @@ class GameHUD:
             for powerup_type, remaining_time in player.active_powerups.items():
                 if powerup_type in self.powerup_icons:
                     # Draw power-up icon
-                    screen.blit(self.powerup_icons[powerup_type], (icon_x, content_y + 5))
-                    
-                    # Draw timer bar under icon
-                    if powerup_type == POWERUP_FIRE_RATE:
-                        max_time = POWERUP_FIRE_RATE_DURATION
-                    elif powerup_type == POWERUP_INVINCIBILITY:
-                        max_time = POWERUP_INVINCIBILITY_DURATION
-                    else:
-                        max_time = 5.0  # Default duration
+                    blit_list.append((self.powerup_icons[powerup_type], (icon_x, content_y + 5)))
                     
-                    self._draw_gradient_bar(
-                        screen, icon_x, content_y + 35, 30, 8,
-                        remaining_time, max_time,
-                        (200, 200, 50), (50, 200, 50)
-                    )
+                    # Draw timer bar under icon; 5.0 is the default
+                    # duration for types without a specific constant
+                    max_time = self._powerup_max_time.get(powerup_type, 5.0)
                     
+                    # Queue the backplate and the filled portion of the
+                    # gradient strip alongside the icon blits
+                    blit_list.append((self._powerup_bar_back, (icon_x, content_y + 35)))
+                    fill_width = int((remaining_time / max_time) * 26)
+                    if fill_width > 0:
+                        blit_list.append((self._powerup_bar_grad,
+                                          (icon_x + 2, content_y + 37),
+                                          pygame.Rect(0, 0, fill_width, 4)))
+
                     icon_x += 40  # Space between power-up icons
         
+        # Submit every queued text/icon blit in one call
+        screen.blits(blit_list, doreturn=False)
+
         # Draw achievement popup if active
         score_system.draw_achievement_popup(screen, self.font)
 
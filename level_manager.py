@@ -1,34 +1,55 @@
 import pygame
 import random
 import math
+from bisect import bisect_right
 from constants import *
 from asteroid import Asteroid
 from ufo import UFO
-from sound import SoundManager
 
-# Try to import sound manager without creating circular imports
-try:
-    from sound import SoundManager
-    sound_manager = SoundManager()
-except ImportError:
-    sound_manager = None
+# Shared semi-transparent transition backdrop, built lazily on first
+# draw (the display must exist for convert_alpha) and reused by every
+# LevelManager instance
+_TRANSITION_OVERLAY = None
+
+def _get_transition_overlay():
+    """Return the shared full-screen transition overlay surface"""
+    global _TRANSITION_OVERLAY
+    if _TRANSITION_OVERLAY is None:
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        _TRANSITION_OVERLAY = overlay.convert_alpha()
+    return _TRANSITION_OVERLAY
 
 class Wave:
     """Represents a single wave of enemies in a level"""
     def __init__(self, asteroids_count, ufo_count, asteroid_size_distribution, boss=False, name="Wave"):
+        # Bound random source for size rolls; the owning LevelManager
+        # replaces it with its own Random instance so gameplay rolls
+        # never contend with other users of the shared module RNG
+        self._random = random.random
+        self.configure(asteroids_count, ufo_count, asteroid_size_distribution, boss, name)
+
+    def configure(self, asteroids_count, ufo_count, asteroid_size_distribution, boss=False, name="Wave"):
+        """(Re)configure the wave parameters and reset its state.
+
+        Lets a pooled Wave be reused across levels instead of
+        allocating fresh objects every time a level is generated.
+        """
         self.asteroids_count = asteroids_count  # Number of asteroids to spawn
         self.ufo_count = ufo_count  # Number of UFOs to spawn
         self.asteroid_size_distribution = asteroid_size_distribution  # Ratio of large:medium:small
         self.boss = boss  # Whether this is a boss wave
         self.name = name  # Name to display
-        
+
+        # Cumulative thresholds and matching sizes, so picking a size
+        # is a single bisect instead of re-summing the distribution
+        self._cum = [asteroid_size_distribution[0],
+                     asteroid_size_distribution[0] + asteroid_size_distribution[1]]
+        self._sizes = (ASTEROID_KINDS, ASTEROID_KINDS - 1, 1)  # Large, medium, small
+
         # Wave state
-        self.asteroids_spawned = 0
-        self.ufos_spawned = 0
-        self.completed = False
-        self.asteroid_timer = 0
-        self.ufo_timer = 0
-        
+        self.reset()
+
     def reset(self):
         """Reset wave state for replaying"""
         self.asteroids_spawned = 0
@@ -36,49 +57,89 @@ class Wave:
         self.completed = False
         self.asteroid_timer = 0
         self.ufo_timer = 0
+        # Set once when both spawn counters reach their limits, so the
+        # per-frame completion check is a flag read instead of three
+        # comparisons (true immediately for waves with nothing to spawn)
+        self._all_spawned = self.asteroids_count <= 0 and self.ufo_count <= 0
         
     def is_complete(self, asteroid_count):
         """Check if wave is complete (all enemies spawned and destroyed)"""
-        return (self.asteroids_spawned >= self.asteroids_count and 
-                self.ufos_spawned >= self.ufo_count and 
-                asteroid_count == 0)
+        return self._all_spawned and asteroid_count == 0
         
     def get_next_asteroid_size(self):
         """Determine size of next asteroid based on distribution"""
-        roll = random.random()
-        if roll < self.asteroid_size_distribution[0]:
-            return ASTEROID_KINDS  # Large
-        elif roll < self.asteroid_size_distribution[0] + self.asteroid_size_distribution[1]:
-            return ASTEROID_KINDS - 1  # Medium
-        else:
-            return 1  # Small
+        return self._sizes[bisect_right(self._cum, self._random())]
 
 class LevelManager:
     """Manages game levels, waves, and difficulty progression"""
-    def __init__(self, difficulty=DIFFICULTY_NORMAL):
+    def __init__(self, difficulty=DIFFICULTY_NORMAL, sound_manager=None):
         self.current_level = 1
         self.difficulty = difficulty
-        self.difficulty_mods = DIFFICULTY_MODIFIERS[difficulty]
+        self.difficulty_mods = DIFFICULTY_MODIFIER_TABLE[difficulty]
+
+        # Sound manager supplied by the caller; the module previously
+        # constructed its own SoundManager (a second mixer client) just
+        # for the two transition cues
+        self._sound = sound_manager
         
         # Level state
         self.current_wave_index = 0
         self.waves = []
+        self._current_wave = None  # Cached waves[current_wave_index]
         self.transition_active = False
         self.transition_timer = 0
         self.transition_duration = 3.0  # seconds
         self.level_complete = False
         self.game_complete = False
         
-        # UI elements
-        self.font = pygame.font.SysFont(None, FONT_SIZE * 2)
-        self.small_font = pygame.font.SysFont(None, FONT_SIZE)
-        
+        # UI elements; Font(None, ...) loads the bundled default font
+        # directly instead of having SysFont enumerate system fonts
+        self.font = pygame.font.Font(None, FONT_SIZE * 2)
+        self.small_font = pygame.font.Font(None, FONT_SIZE)
+
+        # Last formatted wave-progress line, keyed by the four spawn
+        # counters so the f-string is only built when one changes
+        self._progress_key = None
+        self._progress_surf = None
+
+        # Rendered text surfaces keyed by (font, text, color); the HUD
+        # and transition strings change at most a few times per wave,
+        # so steady-state frames blit cached surfaces
+        self._text_cache = {}
+
+        # Dedicated RNG for this manager's spawn rolls, handed to the
+        # pooled waves as a pre-bound method
+        self._rng = random.Random()
+
+        # Pool of Wave objects reused across levels (3 regular waves
+        # plus an optional boss wave); _generate_level reconfigures
+        # these instead of constructing new ones
+        self._wave_pool = [Wave(0, 0, [1.0, 0.0, 0.0]) for _ in range(4)]
+        for wave in self._wave_pool:
+            wave._random = self._rng.random
+
+        # update() is dispatched through a bound method swapped as the
+        # game moves between playing and transition, replacing the
+        # per-frame transition_active branch
+        self.update = self._tick_playing
+
         # Initialize first level
         self._generate_level(self.current_level)
+
+    def _render(self, font, text, color):
+        """Render text through the level-text surface cache"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Converted so cached blits take the same-format fast path
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
         
     def _generate_level(self, level):
         """Generate waves for the given level number"""
-        self.waves = []
+        # Drop the previous level's cached text
+        self._text_cache.clear()
         self.current_wave_index = 0
         self.level_complete = False
         
@@ -91,92 +152,113 @@ class LevelManager:
         ufo_multiplier = 1.0 + ((level - 1) * 0.15)  # 15% more UFOs per level
         
         # Apply difficulty setting
-        asteroid_multiplier *= self.difficulty_mods['spawn_rate_multiplier']
+        asteroid_multiplier *= self.difficulty_mods[MOD_SPAWN_RATE]
         
         # Calculate actual counts
         asteroid_count = max(1, int(base_asteroids * asteroid_multiplier))
         ufo_count = max(0, int(base_ufos * ufo_multiplier))
         
-        # Wave 1: Mostly large asteroids
-        self.waves.append(Wave(
-            asteroids_count=asteroid_count,
-            ufo_count=0,
-            asteroid_size_distribution=[0.7, 0.2, 0.1],  # 70% large, 20% medium, 10% small
-            name=f"Wave 1: Asteroid Field"
-        ))
-        
-        # Wave 2: Mix of asteroids and first UFOs
-        self.waves.append(Wave(
-            asteroids_count=asteroid_count + 2,
-            ufo_count=ufo_count,
-            asteroid_size_distribution=[0.5, 0.3, 0.2],  # More balanced
-            name=f"Wave 2: First Contact"
-        ))
-        
-        # Wave 3: More challenging with faster asteroids
-        self.waves.append(Wave(
-            asteroids_count=asteroid_count + 4,
-            ufo_count=ufo_count + 1,
-            asteroid_size_distribution=[0.3, 0.4, 0.3],  # More medium asteroids
-            name=f"Wave 3: Incoming Storm"
-        ))
+        # Wave specs as (asteroids, ufos, size distribution, boss, name);
+        # the distributions are shared tuples rather than fresh lists
+        wave_specs = [
+            # Wave 1: Mostly large asteroids (70% large, 20% medium, 10% small)
+            (asteroid_count, 0, (0.7, 0.2, 0.1), False, "Wave 1: Asteroid Field"),
+            # Wave 2: Mix of asteroids and first UFOs
+            (asteroid_count + 2, ufo_count, (0.5, 0.3, 0.2), False, "Wave 2: First Contact"),
+            # Wave 3: More challenging, more medium asteroids
+            (asteroid_count + 4, ufo_count + 1, (0.3, 0.4, 0.3), False, "Wave 3: Incoming Storm"),
+        ]
         
         # Boss wave every 3 levels
         if level % 3 == 0:
-            # Boss wave - either a large UFO "mothership" or asteroid swarm
             if level % 6 == 0:
-                # UFO boss wave
-                self.waves.append(Wave(
-                    asteroids_count=asteroid_count // 2,
-                    ufo_count=ufo_count + 3,  # More UFOs
-                    asteroid_size_distribution=[0.2, 0.3, 0.5],  # Mostly small, quick asteroids
-                    boss=True,
-                    name=f"BOSS: UFO Fleet"
-                ))
+                # UFO boss wave: more UFOs, mostly small quick asteroids
+                wave_specs.append((asteroid_count // 2, ufo_count + 3,
+                                   (0.2, 0.3, 0.5), True, "BOSS: UFO Fleet"))
+            else:
+                # Asteroid boss wave: double count, lots of large asteroids
+                wave_specs.append((asteroid_count * 2, 1,
+                                   (0.6, 0.3, 0.1), True, "BOSS: Asteroid Storm"))
+
+        # Configure one pooled wave per spec
+        for wave, spec in zip(self._wave_pool, wave_specs):
+            wave.configure(*spec)
+        self.waves = self._wave_pool[:len(wave_specs)]
+
+        # Cache the active wave so per-frame readers skip the list
+        # indexing; it tracks current_wave_index as waves advance
+        self._current_wave = self.waves[0]
+
+        # Per-level derived values only change here, so compute them
+        # once instead of in the spawn and scoring paths every frame
+        self._asteroid_spawn_delay = max(0.5, 2.0 - (level * 0.1))
+        self._ufo_spawn_delay = max(3.0, 8.0 - (level * 0.5))
+        self._level_multiplier = 1.0 + ((level - 1) * 0.1)
+
+        # Pre-rasterize every transition message for this level with
+        # its centered position, leaving draw_transition as pure blits
+        center_x = SCREEN_WIDTH // 2
+        title_y = SCREEN_HEIGHT // 2 - 40
+        info_y = SCREEN_HEIGHT // 2 + 20
+        for wave in self.waves:
+            name_surf = self._render(self.font, wave.name, (255, 255, 255))
+            wave._name_blit = (name_surf, (center_x - name_surf.get_width() // 2, title_y))
+            if wave.boss:
+                # Boss wave - red alert text
+                info_surf = self._render(self.small_font, "WARNING: Boss Wave Incoming!", (255, 50, 50))
             else:
-                # Asteroid boss wave
-                self.waves.append(Wave(
-                    asteroids_count=asteroid_count * 2,  # Double asteroids
-                    ufo_count=1,
-                    asteroid_size_distribution=[0.6, 0.3, 0.1],  # Lots of large asteroids
-                    boss=True,
-                    name=f"BOSS: Asteroid Storm"
-                ))
+                info_surf = self._render(
+                    self.small_font,
+                    f"Asteroids: {wave.asteroids_count}   UFOs: {wave.ufo_count}",
+                    (200, 200, 200))
+            wave._info_blit = (info_surf, (center_x - info_surf.get_width() // 2, info_y))
+
+        level_surf = self._render(self.font, f"LEVEL {level} COMPLETE!", (255, 255, 255))
+        self._level_complete_blit = (level_surf, (center_x - level_surf.get_width() // 2, title_y))
+        if level < 12:  # Max level
+            next_surf = self._render(self.small_font, f"Prepare for Level {level + 1}", (200, 200, 200))
+        else:
+            # Final level complete
+            next_surf = self._render(self.small_font, "Congratulations! You've completed the game!", (255, 215, 0))
+        self._next_level_blit = (next_surf, (center_x - next_surf.get_width() // 2, info_y))
     
-    def update(self, dt, asteroid_count, spawn_asteroid_func, spawn_ufo_func):
-        """Update level progress and handle wave spawning"""
-        if self.transition_active:
-            # Handle transition screen between waves/levels
-            self.transition_timer -= dt
-            if self.transition_timer <= 0:
-                self.transition_active = False
-                if self.level_complete:
-                    self.current_level += 1
-                    if self.current_level > 12:  # Game complete after level 12
-                        self.game_complete = True
-                    else:
-                        self._generate_level(self.current_level)
-                        self.level_complete = False
-            return
-        
+    def _tick_transition(self, dt, asteroid_count, spawn_asteroid_func, spawn_ufo_func):
+        """update() state: count down the wave/level transition screen"""
+        self.transition_timer -= dt
+        if self.transition_timer <= 0:
+            self.transition_active = False
+            self.update = self._tick_playing
+            if self.level_complete:
+                self.current_level += 1
+                if self.current_level > 12:  # Game complete after level 12
+                    self.game_complete = True
+                else:
+                    self._generate_level(self.current_level)
+                    self.level_complete = False
+
+    def _tick_playing(self, dt, asteroid_count, spawn_asteroid_func, spawn_ufo_func):
+        """update() state: handle wave progress and enemy spawning"""
         # Check if current wave is complete
-        current_wave = self.waves[self.current_wave_index]
-        if current_wave.is_complete(asteroid_count):
+        current_wave = self._current_wave
+        if current_wave._all_spawned and asteroid_count == 0:
             # Move to next wave or level
             self.current_wave_index += 1
             if self.current_wave_index >= len(self.waves):
                 # Level complete
                 self.level_complete = True
                 self.transition_active = True
+                self.update = self._tick_transition
                 self.transition_timer = self.transition_duration
-                if sound_manager:
-                    sound_manager.play_sound('big_explosion')  # Celebration sound
+                if self._sound:
+                    self._sound.play_sound('big_explosion')  # Celebration sound
             else:
                 # Next wave
+                self._current_wave = self.waves[self.current_wave_index]
                 self.transition_active = True
+                self.update = self._tick_transition
                 self.transition_timer = self.transition_duration / 2  # Shorter between waves
-                if sound_manager:
-                    sound_manager.play_sound('ufo_appear')  # Signal new wave
+                if self._sound:
+                    self._sound.play_sound('ufo_appear')  # Signal new wave
             return
         
         # Handle spawning for current wave
@@ -185,9 +267,8 @@ class LevelManager:
         
         # Spawn asteroids
         if current_wave.asteroids_spawned < current_wave.asteroids_count and current_wave.asteroid_timer <= 0:
-            # Calculate asteroid spawn delay (decreases with level)
-            spawn_delay = max(0.5, 2.0 - (self.current_level * 0.1))
-            current_wave.asteroid_timer = spawn_delay
+            # Asteroid spawn delay (decreases with level), precomputed
+            current_wave.asteroid_timer = self._asteroid_spawn_delay
             
             # Determine asteroid size
             size = current_wave.get_next_asteroid_size()
@@ -195,84 +276,77 @@ class LevelManager:
             # Call spawn function from main game
             spawn_asteroid_func(size)
             current_wave.asteroids_spawned += 1
+            if (current_wave.asteroids_spawned >= current_wave.asteroids_count and
+                    current_wave.ufos_spawned >= current_wave.ufo_count):
+                current_wave._all_spawned = True
         
         # Spawn UFOs
         if current_wave.ufos_spawned < current_wave.ufo_count and current_wave.ufo_timer <= 0:
-            # Calculate UFO spawn delay
-            spawn_delay = max(3.0, 8.0 - (self.current_level * 0.5))
-            current_wave.ufo_timer = spawn_delay
+            # UFO spawn delay, precomputed per level
+            current_wave.ufo_timer = self._ufo_spawn_delay
             
             # Call spawn function from main game
             spawn_ufo_func()
             current_wave.ufos_spawned += 1
+            if (current_wave.ufos_spawned >= current_wave.ufo_count and
+                    current_wave.asteroids_spawned >= current_wave.asteroids_count):
+                current_wave._all_spawned = True
     
     def draw_transition(self, screen):
         """Draw level/wave transition screen"""
         if not self.transition_active:
             return
             
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
-        screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, shared at module level
+        screen.blit(_get_transition_overlay(), (0, 0))
         
+        # Everything below was rendered and positioned at level
+        # generation time
         if self.level_complete:
-            # Level complete message
-            level_text = self.font.render(f"LEVEL {self.current_level} COMPLETE!", True, (255, 255, 255))
-            screen.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
-            
-            # Next level message
-            if self.current_level < 12:  # Max level
-                next_text = self.small_font.render(f"Prepare for Level {self.current_level + 1}", True, (200, 200, 200))
-                screen.blit(next_text, (SCREEN_WIDTH // 2 - next_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
-            else:
-                # Final level complete
-                next_text = self.small_font.render("Congratulations! You've completed the game!", True, (255, 215, 0))
-                screen.blit(next_text, (SCREEN_WIDTH // 2 - next_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
+            # Level complete and next level messages
+            screen.blit(*self._level_complete_blit)
+            screen.blit(*self._next_level_blit)
         else:
-            # Wave introduction
-            next_wave = self.waves[self.current_wave_index]
-            wave_text = self.font.render(next_wave.name, True, (255, 255, 255))
-            screen.blit(wave_text, (SCREEN_WIDTH // 2 - wave_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
-            
-            # Wave info
-            if next_wave.boss:
-                # Boss wave - red alert text
-                info_text = self.small_font.render("WARNING: Boss Wave Incoming!", True, (255, 50, 50))
-            else:
-                info_text = self.small_font.render(f"Asteroids: {next_wave.asteroids_count}   UFOs: {next_wave.ufo_count}", True, (200, 200, 200))
-            
-            screen.blit(info_text, (SCREEN_WIDTH // 2 - info_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
+            # Wave introduction: name plus boss warning or enemy counts
+            next_wave = self._current_wave
+            screen.blit(*next_wave._name_blit)
+            screen.blit(*next_wave._info_blit)
     
     def draw_hud(self, screen, x, y):
         """Draw level and wave information on HUD"""
-        level_text = self.small_font.render(f"Level: {self.current_level}", True, (255, 255, 255))
+        level_text = self._render(self.small_font, f"Level: {self.current_level}", (255, 255, 255))
         screen.blit(level_text, (x, y))
         
-        wave_text = self.small_font.render(f"Wave: {self.current_wave_index + 1}/{len(self.waves)}", True, (255, 255, 255))
+        wave_text = self._render(self.small_font, f"Wave: {self.current_wave_index + 1}/{len(self.waves)}", (255, 255, 255))
         screen.blit(wave_text, (x, y + FONT_SIZE))
         
-        # Progress in current wave
-        current_wave = self.waves[self.current_wave_index]
-        progress_text = self.small_font.render(
-            f"Wave Progress: {current_wave.asteroids_spawned}/{current_wave.asteroids_count} asteroids, "
-            f"{current_wave.ufos_spawned}/{current_wave.ufo_count} UFOs", 
-            True, (200, 200, 200)
-        )
-        screen.blit(progress_text, (x, y + FONT_SIZE * 2))
+        # Progress in current wave; the line is only reformatted when
+        # one of the spawn counters actually changes
+        current_wave = self._current_wave
+        progress_key = (current_wave.asteroids_spawned, current_wave.asteroids_count,
+                        current_wave.ufos_spawned, current_wave.ufo_count)
+        if progress_key != self._progress_key:
+            self._progress_surf = self._render(
+                self.small_font,
+                f"Wave Progress: {progress_key[0]}/{progress_key[1]} asteroids, "
+                f"{progress_key[2]}/{progress_key[3]} UFOs",
+                (200, 200, 200)
+            )
+            self._progress_key = progress_key
+        screen.blit(self._progress_surf, (x, y + FONT_SIZE * 2))
         
         return y + FONT_SIZE * 3  # Return next Y position for other HUD elements
     
     def get_score_multiplier(self):
         """Get score multiplier based on current level"""
         # Base multiplier from difficulty setting
-        base_multiplier = self.difficulty_mods['score_multiplier']
+        base_multiplier = self.difficulty_mods[MOD_SCORE]
         
-        # Level multiplier - increases by 0.1 per level
-        level_multiplier = 1.0 + ((self.current_level - 1) * 0.1)
+        # Level multiplier - increases by 0.1 per level, precomputed
+        level_multiplier = self._level_multiplier
         
         # Boss wave bonus
-        if self.waves[self.current_wave_index].boss:
+        if self._current_wave.boss:
             boss_multiplier = 1.5
         else:
             boss_multiplier = 1.0
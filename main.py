@@ -91,8 +91,8 @@ def select_difficulty(screen, font):
 
 def init_game_objects(difficulty):
     """Initialize game objects, sprite groups, and return them"""
-    # Get difficulty modifiers
-    difficulty_mods = DIFFICULTY_MODIFIERS[difficulty]
+    # Get difficulty modifier row
+    difficulty_mods = DIFFICULTY_MODIFIER_TABLE[difficulty]
     
     # Create sprite groups
     updatable = pygame.sprite.Group()
@@ -112,14 +112,17 @@ def init_game_objects(difficulty):
     EnemyProjectile.containers = (enemy_projectiles, updatable, drawable)
     PowerUp.containers = (powerups, updatable, drawable)
     
+    # Drop any asteroids left in the broadphase grid from a previous game
+    Asteroid.reset_grid()
+
     # Create player at center of screen
     player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
     
     # Create asteroid field with difficulty-adjusted speed multiplier
-    asteroid_field = AsteroidField(speed_multiplier=difficulty_mods['asteroid_speed_multiplier'])
-    
+    asteroid_field = AsteroidField(speed_multiplier=difficulty_mods[MOD_ASTEROID_SPEED])
+
     # Apply difficulty modifiers to spawn rates
-    asteroid_field.spawn_rate = ASTEROID_SPAWN_RATE * difficulty_mods['spawn_rate_multiplier']
+    asteroid_field.spawn_rate = ASTEROID_SPAWN_RATE * difficulty_mods[MOD_SPAWN_RATE]
     
     return {
         'player': player,
@@ -139,7 +142,7 @@ def spawn_asteroid(size=None):
     position = edge[1](random.uniform(0, 1))
     if size is None:
         size = random.randint(1, ASTEROID_KINDS)
-    asteroid = Asteroid(position.x, position.y, size)
+    asteroid = Asteroid.spawn(position.x, position.y, size)
     return asteroid
 
 def spawn_ufo():
@@ -181,6 +184,10 @@ def main():
     # Setup screen and clock
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Asteroids")
+
+    # Load meteor sprites once, now that the display exists, instead of
+    # checking on every asteroid spawn
+    Asteroid.load_sprites()
     clock = pygame.time.Clock()
     dt = 0
     
@@ -224,7 +231,7 @@ def main():
                     if result.get('restart'):
                         # Reinitialize game objects
                         game_objects = init_game_objects(difficulty)
-                        level_manager = LevelManager(difficulty)
+                        level_manager = LevelManager(difficulty, sound_manager)
                         game_initialized = True
                     if result.get('back_to_menu'):
                         game_initialized = False
@@ -255,7 +262,7 @@ def main():
             # Initialize game if not already done
             if not game_initialized:
                 game_objects = init_game_objects(difficulty)
-                level_manager = LevelManager(difficulty)
+                level_manager = LevelManager(difficulty, sound_manager)
                 game_initialized = True
                 
             # Unpack game objects for easier access
@@ -283,7 +290,10 @@ def main():
             
             # Update all game objects
             updatable.update(dt)
-        
+
+            # Sweep off-screen enemy shots in one pass
+            EnemyProjectile.cull_offscreen(enemy_projectiles)
+
             # Check collisions between player and power-ups
             for powerup in powerups:
                 if powerup.is_colliding(player):
@@ -293,7 +303,7 @@ def main():
             
             # Check collisions between player and asteroids (only if vulnerable)
             if player.is_vulnerable():
-                for asteroid in asteroids:
+                for asteroid in Asteroid.query_near(player.position.x, player.position.y, player.radius):
                     if asteroid.is_colliding(player):
                         # Record hit for score system
                         game_state_manager.score_system.on_player_hit()
@@ -342,30 +352,32 @@ def main():
                             sound_manager.play_sound('player_death')
                         break  # Exit collision check loop after hit
         
-            # Check collisions between player shots and asteroids
-            for asteroid in asteroids:
-                for shot in shots:
+            # Check collisions between player shots and asteroids, testing
+            # only asteroids the broadphase grid says are near each shot
+            for shot in shots:
+                for asteroid in Asteroid.query_near(shot.position.x, shot.position.y, shot.radius):
                     if shot.is_colliding(asteroid):
                         shot.kill()
-                        
+
                         # Hit the asteroid and check if it was destroyed
                         destroyed = asteroid.hit()
-                        
+
                         if destroyed:
                             # Track asteroid destruction for achievements
                             game_state_manager.score_system.on_asteroid_destroyed()
-                            
+
                             # Add points based on asteroid size and type, adjusted by level multiplier
                             level_multiplier = level_manager.get_score_multiplier()
                             adjusted_score = game_state_manager.score_system.add_score(
                                 asteroid.score_value, level_multiplier)
-                            
+
                             # Play explosion sound based on asteroid size
                             sound_manager.play_explosion_sound(asteroid.radius)
-                            
+
                             # Chance to spawn a power-up
                             if random.random() < POWERUP_SPAWN_CHANCE:
                                 PowerUp(asteroid.position.x, asteroid.position.y)
+                        break  # Shot is spent either way
             
             # Check collisions between player shots and UFOs
             for ufo in ufos:
@@ -385,9 +397,11 @@ def main():
                         # Play explosion sound
                         sound_manager.play_sound('explosion_large')
             
-            # Draw game objects
+            # Draw game objects; asteroids go through the batched path
             for item in drawable:
-                item.draw(screen)
+                if not isinstance(item, Asteroid):
+                    item.draw(screen)
+            Asteroid.draw_all(screen, asteroids)
                 
             # Create HUD instance if it doesn't exist
             if 'hud' not in locals():
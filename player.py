@@ -162,8 +162,12 @@ class Player(CircleShape):
             self.shoot()
 
     def move(self,dt):
-        forward = pygame.Vector2(0, -1).rotate(self.rotation)
-        self.position += forward * PLAYER_SPEED * dt
+        # Step along the facing direction without building throwaway
+        # Vector2s for the speed scaling
+        angle = math.radians(self.rotation)
+        step = PLAYER_SPEED * dt
+        self.position.x += math.sin(angle) * step
+        self.position.y -= math.cos(angle) * step
 
     def shoot(self):
         # Apply fire rate power-up if active
@@ -34,7 +34,8 @@ class PowerUp(CircleShape):
         
     def update(self, dt):
         # Update position based on velocity
-        self.position += self.velocity * dt
+        self.position.x += self.velocity.x * dt
+        self.position.y += self.velocity.y * dt
         
         # Bounce off screen edges
         if self.position.x < self.radius:
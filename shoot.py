@@ -89,7 +89,8 @@ class Shoot(CircleShape):
         
     def update(self, dt):
         """Update bullet position and effects"""
-        self.position += (self.velocity * dt)
+        self.position.x += self.velocity.x * dt
+        self.position.y += self.velocity.y * dt
         
     def kill(self):
         """Handle bullet destruction with effects"""
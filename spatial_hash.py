@@ -0,0 +1,58 @@
+class SpatialHash:
+    """Uniform-grid broadphase for circle-shaped game objects.
+
+    Objects are bucketed by the grid cell containing their center; queries
+    return every object in the cells overlapping a circle's bounding box,
+    so callers should inflate the query radius by the largest object radius.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> set of objects
+
+    def _cell(self, x, y):
+        cell_size = self.cell_size
+        return (int(x // cell_size), int(y // cell_size))
+
+    def insert(self, obj):
+        """Add an object and return its cell key for later updates"""
+        cell = self._cell(obj.position.x, obj.position.y)
+        self.cells.setdefault(cell, set()).add(obj)
+        return cell
+
+    def remove(self, obj, cell):
+        """Remove an object from the cell it was last filed under"""
+        bucket = self.cells.get(cell)
+        if bucket is not None:
+            bucket.discard(obj)
+            if not bucket:
+                del self.cells[cell]
+
+    def move(self, obj, old_cell):
+        """Re-file an object after a position change; returns the new cell"""
+        new_cell = self._cell(obj.position.x, obj.position.y)
+        if new_cell != old_cell:
+            self.remove(obj, old_cell)
+            self.cells.setdefault(new_cell, set()).add(obj)
+        return new_cell
+
+    def query(self, x, y, radius):
+        """Return a list of candidates near the given circle"""
+        cell_size = self.cell_size
+        x0 = int((x - radius) // cell_size)
+        x1 = int((x + radius) // cell_size)
+        y0 = int((y - radius) // cell_size)
+        y1 = int((y + radius) // cell_size)
+
+        candidates = []
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    def clear(self):
+        """Drop all objects (e.g. when a new game starts)"""
+        self.cells.clear()
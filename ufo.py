@@ -235,7 +235,8 @@ class UFO(CircleShape):
         self.movement_pattern(dt)
         
         # Update position
-        self.position += self.velocity * dt
+        self.position.x += self.velocity.x * dt
+        self.position.y += self.velocity.y * dt
         
         # Wrap around screen edges
         if self.position.x < -self.radius: